@@ -2,7 +2,9 @@ import streamlit as st
 from datetime import datetime
 import json
 import random
-from utils_calibration import extract_text_from_pdf, extract_text_from_docx, analyze_resume_strengths, generate_calibration_test, evaluate_answer
+from utils_calibration import extract_text_from_pdf, extract_text_from_docx, analyze_resume_strengths, generate_calibration_test, evaluate_answer, evaluate_answers
+from groq_client import get_llm_cache
+from rate_limiter import get_rate_limiter
 
 # --- PAGE CONFIG ---
 st.set_page_config(page_title="Skill Calibration | CodeSprint", page_icon="🎯", layout="wide")
@@ -28,26 +30,30 @@ if 'questions' not in st.session_state:
     st.session_state.questions = []
 if 'scores' not in st.session_state:
     st.session_state.scores = []
+if 'evaluations' not in st.session_state:
+    st.session_state.evaluations = {}
 
 # --- SIDEBAR ---
 with st.sidebar:
     st.header("⚙️ Settings")
-    st.info("Groq API key required for AI-based analysis")
+    st.info("Groq API key required for AI-based analysis (keyword-based skill extraction works without one)")
     groq_api_key = st.text_input("Groq API Key", type="password", help="Get it at https://console.groq.com")
 
     st.markdown("---")
     st.header("📍 Stages")
     st.markdown("1️⃣ Upload Resume\n\n 2️⃣ Extract Skills\n\n 3️⃣ Calibration Test\n\n 4️⃣ Path Recommendation")
 
+    llm_cache = get_llm_cache().stats()
+    st.caption(f"🗄️ LLM cache: {llm_cache['hits']} hits / {llm_cache['misses']} misses")
+    limiter = get_rate_limiter(groq_api_key).stats() if groq_api_key else None
+    if limiter and (limiter['waiting'] or limiter['throttled']):
+        st.caption(f"⏳ Groq queue: {limiter['waiting']} waiting, throttled {limiter['throttled']} times")
+
     if st.button("🏠 Restart"):
         for key in list(st.session_state.keys()):
             del st.session_state[key]
         st.rerun()
 
-if not groq_api_key:
-    st.warning("Please enter your Groq API key to continue.")
-    st.stop()
-
 # --- STAGE 1: Resume Upload ---
 if st.session_state.stage == 'upload':
     st.title("📄 Step 1: Upload Your Resume")
@@ -58,7 +64,13 @@ if st.session_state.stage == 'upload':
     if uploaded:
         with st.spinner("Extracting resume text..."):
             if uploaded.type == "application/pdf":
-                resume_text = extract_text_from_pdf(uploaded)
+                progress = st.empty()
+
+                def show_pages(done, total, progress=progress):
+                    progress.progress(done / total, text=f"Extracted {done}/{total} pages")
+
+                resume_text = extract_text_from_pdf(uploaded, on_page=show_pages)
+                progress.empty()
             else:
                 resume_text = extract_text_from_docx(uploaded)
 
@@ -78,6 +90,9 @@ if st.session_state.stage == 'upload':
 elif st.session_state.stage == 'assess':
     st.title("🎯 Step 2: Skill & Strength Profiling")
 
+    if not groq_api_key:
+        st.caption("🔎 No Groq API key: using offline keyword-based skill extraction")
+
     if not st.session_state.strengths:
         with st.spinner("Analyzing resume for skill areas..."):
             st.session_state.strengths = analyze_resume_strengths(st.session_state.resume_text, groq_api_key)
@@ -95,22 +110,52 @@ elif st.session_state.stage == 'assess':
 elif st.session_state.stage == 'test':
     st.title("🧠 Step 3: Calibration Test")
 
+    if not groq_api_key:
+        st.warning("Please enter your Groq API key to take the calibration test.")
+        st.stop()
+
     if not st.session_state.questions:
         with st.spinner("Generating calibration questions..."):
             st.session_state.questions = generate_calibration_test(st.session_state.strengths, groq_api_key)
 
     st.info("Answer the following short coding or conceptual questions:")
 
+    def record_evaluation(i, result):
+        st.session_state.evaluations[i] = result
+        st.session_state.scores = [r['score'] for _, r in sorted(st.session_state.evaluations.items())]
+
     for i, q in enumerate(st.session_state.questions, 1):
         with st.expander(f"Question {i}: {q['topic']} ({q['difficulty']})", expanded=i == 1):
             st.markdown(f"**{q['question']}**")
             ans = st.text_area("Your Answer", key=f"ans_{i}")
 
             if st.button(f"Evaluate {i}", key=f"eval_{i}"):
-                with st.spinner("Evaluating your response..."):
-                    result = evaluate_answer(q['question'], ans, groq_api_key)
-                    st.session_state.scores.append(result['score'])
-                    st.success(f"✅ Score: {result['score']}/10 — {result['feedback']}")
+                live = st.empty()
+                live.info("Evaluating your response...")
+
+                def show_progress(fields, partial, live=live):
+                    score = f"**Score: {fields['score']}/10**" if 'score' in fields else "Scoring..."
+                    feedback = fields.get('feedback') or (partial[1] if partial and partial[0] == 'feedback' else "")
+                    live.info(f"{score}\n\n{feedback}")
+
+                result = evaluate_answer(q['question'], ans, groq_api_key, on_progress=show_progress)
+                live.empty()
+                record_evaluation(i, result)
+
+            if i in st.session_state.evaluations:
+                result = st.session_state.evaluations[i]
+                st.success(f"✅ Score: {result['score']}/10 — {result['feedback']}")
+
+    answered = [
+        (i, q) for i, q in enumerate(st.session_state.questions, 1)
+        if st.session_state.get(f"ans_{i}", "").strip()
+    ]
+    if st.button(f"⚡ Evaluate all answered ({len(answered)})", disabled=not answered):
+        with st.spinner(f"Evaluating {len(answered)} answers in parallel..."):
+            results = evaluate_answers([(q['question'], st.session_state[f"ans_{i}"]) for i, q in answered], groq_api_key)
+        for (i, _), result in zip(answered, results):
+            record_evaluation(i, result)
+        st.rerun()
 
     if st.button("➡️ See Skill Path Recommendation", type="primary"):
         st.session_state.stage = 'summary'
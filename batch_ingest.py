@@ -0,0 +1,264 @@
+"""Headless bulk resume ingestion: a directory of PDF/DOCX files -> Parquet skill profiles.
+
+Text is extracted in sandbox worker processes under the PDF pool's per-page
+time, CPU and memory limits (a file that hits one is recorded as failed and its
+worker replaced), strengths are profiled with at most
+--llm-concurrency Groq calls in flight (or offline keyword matching without an
+API key), and rows are appended to OUTPUT/part-*.parquet every --batch-size
+files. Re-running with the same output skips files already written, matched
+by content hash, so an interrupted run picks up where it stopped. Files that
+failed (including Groq errors and unusable LLM replies) are skipped too
+unless --retry-failed is given; retries append a new row, so readers should
+keep the latest processed_at per sha256.
+
+    python batch_ingest.py resumes/ --output data/profiles --llm-concurrency 4
+"""
+import argparse
+import datetime
+import glob
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from docx_extract import extract_docx_text
+from pdf_extract import PAGE_CPU_SECONDS, PAGE_TIMEOUT_SECONDS, PDF_WORKER_MEMORY_MB
+from sandbox import SandboxPool, SandboxError, SandboxTimeout
+
+
+DEFAULT_OUTPUT = "data/profiles"
+EXTENSIONS = (".pdf", ".docx")
+BATCH_SIZE = 100
+LLM_CONCURRENCY = 4
+# Extraction jobs queued per worker, so thousands of texts are never held at once
+EXTRACT_BACKLOG_PER_WORKER = 4
+
+SCHEMA = pa.schema([
+    ("path", pa.string()),
+    ("file_name", pa.string()),
+    ("sha256", pa.string()),
+    ("kind", pa.string()),
+    ("chars", pa.int64()),
+    ("strengths", pa.list_(pa.struct([("strength", pa.string()), ("explanation", pa.string())]))),
+    ("keyword_skills", pa.list_(pa.string())),
+    ("text", pa.string()),
+    ("error", pa.string()),
+    ("processed_at", pa.timestamp("s", tz="UTC")),
+])
+
+
+def find_documents(input_dir, recursive=True):
+    pattern = os.path.join(input_dir, "**", "*") if recursive else os.path.join(input_dir, "*")
+    return sorted(p for p in glob.glob(pattern, recursive=recursive)
+                  if os.path.isfile(p) and p.lower().endswith(EXTENSIONS))
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_document_text(path):
+    """Worker target: yield the text of each PDF page in order, or of the whole DOCX"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.lower().endswith(".pdf"):
+        from pdf_extract import iter_pdf_pages
+        for _, _, text in iter_pdf_pages(data, parallel=False):
+            yield text
+    else:
+        yield extract_docx_text(data)
+
+
+def extract_document(pool, path):
+    """(text, error) for one file; never raises.
+
+    Each page (or DOCX) must arrive within PAGE_TIMEOUT_SECONDS and
+    PAGE_CPU_SECONDS, so a pathological file fails instead of holding a
+    worker forever.
+    """
+    try:
+        return "\n".join(pool.stream(iter_document_text, (path,), PAGE_TIMEOUT_SECONDS, PAGE_CPU_SECONDS)), None
+    except SandboxTimeout as e:
+        return None, f"TimeoutError: {e}"
+    except SandboxError as e:
+        return None, str(e)
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def completed_hashes(output_dir, retry_failed=False):
+    """Content hashes already in the dataset (excluding failures if retry_failed)"""
+    parts = sorted(glob.glob(os.path.join(output_dir, "part-*.parquet")))
+    done = set()
+    for part in parts:
+        table = pq.read_table(part, columns=["sha256", "error"])
+        for sha, error in zip(table.column("sha256").to_pylist(), table.column("error").to_pylist()):
+            if error is None or not retry_failed:
+                done.add(sha)
+    return done
+
+
+class ParquetAppender:
+    """Buffers rows and writes each batch as a new part file (written to a temp name, then renamed)"""
+
+    def __init__(self, output_dir, batch_size=BATCH_SIZE):
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+        self.rows = []
+        self.written = 0
+        os.makedirs(output_dir, exist_ok=True)
+
+    def add(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        # Nanosecond timestamp names keep part files unique and ordered across runs
+        name = f"part-{time.time_ns()}.parquet"
+        tmp = os.path.join(self.output_dir, f".{name}.tmp")
+        pq.write_table(pa.Table.from_pylist(self.rows, schema=SCHEMA), tmp)
+        os.replace(tmp, os.path.join(self.output_dir, name))
+        self.written += len(self.rows)
+        self.rows = []
+
+
+def profile_text(text, api_key):
+    """(strengths, keyword_skills); raises when the LLM call fails so the row is recorded as failed.
+
+    Not analyze_resume_strengths: it falls back to keywords on Groq errors,
+    which would write a failed call as a finished row that is never retried.
+    """
+    from rate_limiter import PRIORITY_BATCH
+    from skill_extractor import extract_skills
+    from utils_calibration import request_strengths
+
+    keyword_skills = [s["strength"] for s in extract_skills(text, top_n=20)]
+    if not text.strip():
+        return [], keyword_skills
+    if not api_key:
+        return extract_skills(text), keyword_skills
+    strengths, _ = request_strengths(text, api_key, priority=PRIORITY_BATCH)
+    if strengths is None:
+        raise ValueError("LLM reply could not be parsed as strengths")
+    return strengths, keyword_skills
+
+
+def ingest(input_dir, output_dir=DEFAULT_OUTPUT, api_key=None, workers=None, llm_concurrency=LLM_CONCURRENCY,
+           batch_size=BATCH_SIZE, include_text=False, retry_failed=False, recursive=True, log=print):
+    """Run the pipeline; returns {"found", "skipped", "processed", "failed"}"""
+    paths = find_documents(input_dir, recursive)
+    done = completed_hashes(output_dir, retry_failed)
+    pending = []
+    for path in paths:
+        sha = file_sha256(path)
+        if sha not in done:
+            done.add(sha)  # identical copies in the same run are only processed once
+            pending.append((path, sha))
+    stats = {"found": len(paths), "skipped": len(paths) - len(pending), "processed": 0, "failed": 0}
+    log(f"{stats['found']} documents, {stats['skipped']} already ingested or duplicates, {len(pending)} to process")
+    if not pending:
+        return stats
+
+    workers = workers or os.cpu_count() or 1
+    appender = ParquetAppender(output_dir, batch_size)
+
+    def row_for(path, sha, text, error, strengths=(), keyword_skills=()):
+        return {
+            "path": os.path.abspath(path),
+            "file_name": os.path.basename(path),
+            "sha256": sha,
+            "kind": os.path.splitext(path)[1].lower().lstrip("."),
+            "chars": len(text or ""),
+            "strengths": list(strengths),
+            "keyword_skills": list(keyword_skills),
+            "text": text if include_text else None,
+            "error": error,
+            "processed_at": datetime.datetime.now(datetime.timezone.utc),
+        }
+
+    def profile(path, sha, text):
+        try:
+            strengths, keyword_skills = profile_text(text, api_key)
+            return row_for(path, sha, text, None, strengths, keyword_skills)
+        except Exception as e:
+            return row_for(path, sha, text, f"{type(e).__name__}: {e}")
+
+    queue = iter(pending)
+    extracting, profiling = {}, set()
+    sandbox = SandboxPool(workers, PDF_WORKER_MEMORY_MB, PAGE_CPU_SECONDS)
+    try:
+        # One thread per sandbox worker; each blocks on its file's stream
+        with ThreadPoolExecutor(workers) as extract_pool, ThreadPoolExecutor(llm_concurrency) as llm_pool:
+            while True:
+                # Bounded backlogs: extraction stalls while too many texts await profiling
+                while len(extracting) < workers * EXTRACT_BACKLOG_PER_WORKER and len(profiling) < llm_concurrency * 2:
+                    item = next(queue, None)
+                    if item is None:
+                        break
+                    extracting[extract_pool.submit(extract_document, sandbox, item[0])] = item
+                if not extracting and not profiling:
+                    break
+
+                finished, _ = wait(list(extracting) + list(profiling), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    if future in extracting:
+                        path, sha = extracting.pop(future)
+                        text, error = future.result()
+                        if error:
+                            appender.add(row_for(path, sha, None, error))
+                            stats["failed"] += 1
+                            log(f"FAILED {path}: {error}")
+                        else:
+                            profiling.add(llm_pool.submit(profile, path, sha, text))
+                    else:
+                        profiling.discard(future)
+                        row = future.result()
+                        appender.add(row)
+                        stats["failed" if row["error"] else "processed"] += 1
+                        done_count = stats["processed"] + stats["failed"]
+                        if done_count % batch_size == 0:
+                            log(f"{done_count}/{len(pending)} done")
+    finally:
+        # Whatever finished before an interruption is kept, so the next run resumes after it
+        appender.flush()
+        sandbox.shutdown()
+    log(f"Processed {stats['processed']}, failed {stats['failed']}; rows in {output_dir}")
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input_dir")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Parquet dataset directory")
+    parser.add_argument("--api-key", default=os.environ.get("GROQ_API_KEY"),
+                        help="Groq API key (default $GROQ_API_KEY); without one, keyword profiling only")
+    parser.add_argument("--workers", type=int, help="Extraction processes (default: CPU count)")
+    parser.add_argument("--llm-concurrency", type=int, default=LLM_CONCURRENCY, help="Max Groq calls in flight")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Rows per Parquet part file")
+    parser.add_argument("--include-text", action="store_true", help="Store the extracted text too")
+    parser.add_argument("--retry-failed", action="store_true", help="Process files that failed last time again")
+    parser.add_argument("--no-recursive", action="store_true", help="Only look at the top-level directory")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"{args.input_dir} is not a directory")
+    import streamlit.logger
+    streamlit.logger.set_log_level("error")
+    stats = ingest(args.input_dir, args.output, args.api_key, args.workers, args.llm_concurrency, args.batch_size,
+                   args.include_text, args.retry_failed, not args.no_recursive)
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
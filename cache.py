@@ -0,0 +1,207 @@
+import collections
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+
+CACHE_DIR = "data/cache"
+MEMORY_MAX_ENTRIES = 256
+DISK_MAX_ENTRIES = 5000
+DISK_TTL_SECONDS = 7 * 24 * 3600
+
+
+def make_key(*parts):
+    """Stable content hash for any JSON-able key parts"""
+    raw = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with optional TTL and hit/miss counters"""
+
+    def __init__(self, max_entries=MEMORY_MAX_ENTRIES, ttl_seconds=None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()  # key -> (value, expires_at or None)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] is not None and time.time() >= entry[1]:
+                del self._data[key]
+                entry = None
+            if entry is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, created_at=None):
+        """Store value; with a TTL it expires ttl_seconds after created_at (default: now)"""
+        expires_at = None
+        if self.ttl_seconds:
+            expires_at = (created_at or time.time()) + self.ttl_seconds
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        return {"entries": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+class DiskCache:
+    """SQLite-backed cache with TTL, size-bounded LRU eviction and hit/miss counters.
+
+    Values are pickled, so only use it for data this app produced itself.
+    """
+
+    def __init__(self, path, max_entries=DISK_MAX_ENTRIES, ttl_seconds=DISK_TTL_SECONDS):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key, default=None):
+        found = self.lookup(key)
+        return default if found is None else found[0]
+
+    def lookup(self, key):
+        """(value, created_at) for a live entry, or None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.ttl_seconds and now - row[1] > self.ttl_seconds):
+                if row is not None:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        try:
+            return pickle.loads(row[0]), row[1]
+        except Exception:
+            return None
+
+    def set(self, key, value):
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, blob, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        if self.ttl_seconds:
+            self._conn.execute("DELETE FROM cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute("""
+                DELETE FROM cache WHERE key IN (
+                    SELECT key FROM cache ORDER BY accessed_at ASC LIMIT ?
+                )
+            """, (count - self.max_entries,))
+
+    def delete(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        return {"entries": count, "hits": self.hits, "misses": self.misses}
+
+
+class TieredCache:
+    """In-memory LRU in front of a DiskCache; disk hits are promoted to memory.
+
+    Both tiers honour the TTL, counted from when the entry was first stored.
+    """
+
+    def __init__(self, path, memory_entries=MEMORY_MAX_ENTRIES, disk_entries=DISK_MAX_ENTRIES,
+                 ttl_seconds=DISK_TTL_SECONDS):
+        self.memory = LRUCache(memory_entries, ttl_seconds)
+        self.disk = DiskCache(path, disk_entries, ttl_seconds)
+
+    def get(self, key, default=None):
+        value = self.memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        found = self.disk.lookup(key)
+        if found is None:
+            return default
+        value, created_at = found
+        self.memory.set(key, value, created_at)
+        return value
+
+    def set(self, key, value):
+        self.memory.set(key, value)
+        self.disk.set(key, value)
+
+    def delete(self, key):
+        self.memory.delete(key)
+        self.disk.delete(key)
+
+    def clear(self):
+        self.memory.clear()
+        self.disk.clear()
+
+    def stats(self):
+        memory, disk = self.memory.stats(), self.disk.stats()
+        return {"hits": memory["hits"] + disk["hits"], "misses": disk["misses"], "memory": memory, "disk": disk}
+
+
+_MISSING = object()
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(name, **kwargs):
+    """Process-wide TieredCache stored at CACHE_DIR/<name>.db"""
+    with _caches_lock:
+        if name not in _caches:
+            _caches[name] = TieredCache(os.path.join(CACHE_DIR, f"{name}.db"), **kwargs)
+        return _caches[name]
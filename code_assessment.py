@@ -0,0 +1,73 @@
+import streamlit as st
+
+from complexity import format_complexity_report
+from groq_client import chat_completion, stream_chat_completion
+from json_stream import IncrementalJSONObject
+from profiler import format_hotspots
+
+
+def assess_code_with_ai(question_desc, user_code, test_results, api_key, complexity_report=None, hotspots=None,
+                        on_progress=None):
+    """Use Groq AI to assess the code quality and approach.
+
+    Pass on_progress(fields, partial) to stream the reply and show scores as they arrive.
+    """
+    passed_tests = sum(1 for r in test_results if r['passed'])
+    total_tests = len(test_results)
+    complexity_note = ""
+    if complexity_report:
+        complexity_note = f"""
+Measured Complexity (empirical, from runs on growing inputs): {format_complexity_report(complexity_report)}
+"""
+        if complexity_report.get('reliable') and complexity_report.get('error') is None:
+            complexity_note += "Base the efficiency_score on this measurement rather than on reading the code.\n"
+    if hotspots:
+        complexity_note += f"""
+Profiler hotspots on the largest test input (cProfile, sorted by cumulative time):
+{format_hotspots(hotspots)}
+"""
+
+    prompt = f"""You are an expert coding interviewer. Assess the following coding solution:
+
+Question: {question_desc}
+
+Candidate's Code:
+```python
+{user_code}
+```
+
+Test Results: {passed_tests}/{total_tests} tests passed
+{complexity_note}
+Provide assessment in JSON format:
+{{
+    "correctness_score": <1-10>,
+    "code_quality_score": <1-10>,
+    "efficiency_score": <1-10>,
+    "overall_score": <1-10>,
+    "strengths": ["..."],
+    "weaknesses": ["..."],
+    "suggestions": ["..."],
+    "verdict": "Pass/Fail/Borderline"
+}}
+
+Focus on: correctness, code quality, time/space complexity, edge cases, readability.
+"""
+
+    try:
+        if on_progress:
+            parser = IncrementalJSONObject()
+            for chunk in stream_chat_completion(prompt, api_key, max_tokens=1500, temperature=0.3):
+                parser.feed(chunk)
+                on_progress(parser.fields, parser.partial)
+            result = parser.text
+        else:
+            result = chat_completion(prompt, api_key, max_tokens=1500, temperature=0.3)
+        from llm_schemas import parse_structured, CodeAssessment
+        assessment = parse_structured(result, CodeAssessment, prompt, api_key, max_tokens=1500, temperature=0.3)
+        if assessment is None:
+            st.error("AI assessment reply could not be parsed")
+            return None
+        return assessment.model_dump()
+    except Exception as e:
+        st.error(f"Error in AI assessment: {e}")
+        return None
@@ -0,0 +1,199 @@
+import copy
+import math
+import random
+import string
+import time
+import tracemalloc
+
+from harness import load_entry_function, call_entry
+from sandbox import get_sandbox_pool, SandboxError
+
+
+# Growth classes by the fitted exponent k of value ~ n^k: a class is picked when k is
+# below its bound. Over 2^8..2^17, log n fits k ~ 0.12 and n log n fits k ~ 1.12.
+SLOPE_BANDS = (
+    ("O(1)", 0.06),
+    ("O(log n)", 0.5),
+    ("O(n)", 1.06),
+    ("O(n log n)", 1.5),
+    ("O(n^2)", math.inf),
+)
+# Pairs whose slopes are within timing noise of each other on practical sizes
+NEIGHBOUR_CLASSES = {frozenset(("O(1)", "O(log n)")), frozenset(("O(n)", "O(n log n)"))}
+
+START_SIZE = 256
+MAX_SIZE = 2 ** 17
+RUN_BUDGET_SECONDS = 0.25
+MIN_POINTS = 4
+TIMING_REPEATS = 3
+MEMORY_FLOOR_BYTES = 1024
+
+
+def normalize_complexity(label):
+    """Normalize a complexity label such as 'O(n²)' or 'O(N log N)' to 'O(n^2)' / 'O(n log n)'"""
+    if not label:
+        return None
+    text = label.strip().lower().replace("²", "^2").replace("**", "^")
+    text = " ".join(text.replace("(", " ( ").replace(")", " ) ").split())
+    text = text.replace("( ", "(").replace(" )", ")").replace("o (", "o(")
+    text = text.replace("logn", "log n").replace("nlog", "n log").replace("n*n", "n^2")
+    return text.replace("o(", "O(", 1)
+
+
+# Input scaling
+def _scale_value(value, n, rng, scale_scalars):
+    if isinstance(value, list):
+        if value and all(isinstance(v, int) and not isinstance(v, bool) for v in value):
+            scaled = [rng.randint(-10 * n, 10 * n) for _ in range(n)]
+            if value == sorted(value):
+                scaled.sort()
+            return scaled
+        if value:
+            return [rng.choice(value) for _ in range(n)]
+        return value
+    if isinstance(value, str):
+        alphabet = "".join(sorted(set(value))) or string.ascii_lowercase
+        return "".join(rng.choice(alphabet) for _ in range(n))
+    if scale_scalars and isinstance(value, int) and not isinstance(value, bool):
+        return n
+    return value
+
+
+def scale_input(sample_input, n, seed=0):
+    """Grow a sample test input to size n.
+
+    Sequences are regenerated with n elements drawn like the sample's; plain
+    integers are treated as the size parameter only when there is no sequence.
+    """
+    rng = random.Random(seed)
+    values = sample_input.values() if isinstance(sample_input, dict) else [sample_input]
+    scale_scalars = not any(isinstance(v, (list, str)) for v in values)
+    if isinstance(sample_input, dict):
+        return {k: _scale_value(v, n, rng, scale_scalars) for k, v in sample_input.items()}
+    return _scale_value(sample_input, n, rng, scale_scalars)
+
+
+# Measurement (runs inside a sandbox worker)
+def _measure(func, make_input):
+    best = None
+    for _ in range(TIMING_REPEATS):
+        input_data = make_input()
+        start = time.perf_counter()
+        call_entry(func, input_data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        if elapsed > RUN_BUDGET_SECONDS:
+            # Too slow to repeat under tracemalloc as well; time-only data point
+            return best, None
+
+    input_data = make_input()
+    tracemalloc.start()
+    try:
+        call_entry(func, input_data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def iter_growth_measurements(code, sample_input, seed=0, make_input=None, max_size=MAX_SIZE):
+    """Yield {n, seconds, peak_bytes} for doubling input sizes until a run exceeds the budget"""
+    func = load_entry_function(code)
+    make_input = make_input or (lambda size: copy.deepcopy(scale_input(sample_input, size, seed)))
+    n = START_SIZE
+    while n <= max_size:
+        seconds, peak = _measure(func, lambda: make_input(n))
+        yield {"n": n, "seconds": seconds, "peak_bytes": peak}
+        if seconds > RUN_BUDGET_SECONDS:
+            break
+        n *= 2
+
+
+# Fitting
+def fit_growth_class(sizes, values, floor=0.0):
+    """(growth class, exponent) from a least-squares fit of log(value) against log(n).
+
+    Values below floor are raised to it, so measurements lost in the noise
+    read as flat. The exponent is mapped to a class through SLOPE_BANDS.
+    """
+    if len(sizes) < 2:
+        return None, None
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(v, floor, 1e-12)) for v in values]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+    label = next(label for label, bound in SLOPE_BANDS if slope < bound)
+    return label, slope
+
+
+def classes_match(measured, expected):
+    """Whether a measured class is consistent with the expected one (neighbouring classes count)"""
+    if not measured or not expected:
+        return False
+    return measured == expected or frozenset((measured, expected)) in NEIGHBOUR_CLASSES
+
+
+def estimate_from_measurements(measurements, expected_time=None, expected_space=None):
+    """Build a complexity report from growth measurements"""
+    sizes = [m["n"] for m in measurements]
+    time_class, _ = fit_growth_class(sizes, [m["seconds"] for m in measurements])
+    traced = [m for m in measurements if m["peak_bytes"] is not None]
+    space_class, _ = fit_growth_class(
+        [m["n"] for m in traced], [m["peak_bytes"] for m in traced], floor=MEMORY_FLOOR_BYTES
+    )
+    expected_time = normalize_complexity(expected_time)
+    expected_space = normalize_complexity(expected_space)
+    return {
+        "time_class": time_class,
+        "space_class": space_class,
+        "expected_time": expected_time,
+        "expected_space": expected_space,
+        "time_matches": classes_match(time_class, expected_time),
+        "space_matches": classes_match(space_class, expected_space),
+        "reliable": len(measurements) >= MIN_POINTS,
+        "measurements": measurements,
+    }
+
+
+def estimate_complexity(code, test_cases, expected_time=None, expected_space=None, make_input=None, timeout=10,
+                        max_size=None):
+    """Run the submission on growing inputs in the sandbox and estimate its time/space class.
+
+    make_input(n) is the question's own input generator if it declares one (see
+    stress.input_maker); otherwise the largest stored test case is scaled up.
+    max_size caps n (default MAX_SIZE) for questions whose real cost stops
+    matching their stated class on large inputs (see stress.complexity_max_size).
+    """
+    if not test_cases and make_input is None:
+        return None
+    sample_input = max((t["input"] for t in test_cases), key=lambda i: len(repr(i))) if test_cases else None
+    measurements = []
+    error = None
+    try:
+        args = (code, sample_input, 0, make_input, max_size or MAX_SIZE)
+        for m in get_sandbox_pool().stream(iter_growth_measurements, args, timeout):
+            measurements.append(m)
+    except SandboxError as e:
+        error = str(e)
+
+    report = estimate_from_measurements(measurements, expected_time, expected_space)
+    report["error"] = error
+    return report
+
+
+def format_complexity_report(report):
+    """One-line summary of a complexity report for prompts and the UI"""
+    if not report or not report["measurements"]:
+        return "Complexity could not be measured"
+    largest = report["measurements"][-1]
+    peak = largest["peak_bytes"]
+    peak_text = f"peak {peak / 1024:.1f} KiB" if peak is not None else "peak not traced"
+    summary = (
+        f"Measured time ~{report['time_class']} (expected {report['expected_time'] or 'n/a'}), "
+        f"space ~{report['space_class']} (expected {report['expected_space'] or 'n/a'}); "
+        f"largest n={largest['n']} took {largest['seconds'] * 1000:.1f} ms, {peak_text}"
+    )
+    if not report["reliable"]:
+        summary += " (few data points, low confidence)"
+    return summary
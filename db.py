@@ -0,0 +1,104 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+# Both files are created on first use (live_coding's init_database seeds the questions)
+# and are not tracked: switching them to WAL rewrites the file header
+QUESTIONS_DB = "coding_questions.db"
+PROGRESS_DB = "data/progress.db"
+
+# WAL lets leaderboard readers run while another session writes progress
+SQLITE_PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),  # durable at checkpoints; safe with WAL
+    ("cache_size", -16000),  # KiB, i.e. 16 MB of page cache per connection
+    ("mmap_size", 64 * 1024 * 1024),
+    ("temp_store", "MEMORY"),
+)
+BUSY_TIMEOUT_SECONDS = 5
+# Prepared statements kept per connection, keyed by SQL text
+STATEMENT_CACHE_SIZE = 128
+MAX_IDLE_CONNECTIONS = 8
+
+
+def connect(path):
+    """New SQLite connection with the pool's pragmas applied"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False,
+                           cached_statements=STATEMENT_CACHE_SIZE)
+    for name, value in SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+
+class ConnectionPool:
+    """Reusable SQLite connections for one database file.
+
+    A thread checks a connection out for the duration of a `connection()`
+    block (nested blocks on the same thread share it) and hands it back
+    afterwards, so Streamlit reruns reuse open connections, their pragmas and
+    their prepared-statement cache instead of reconnecting every time.
+    """
+
+    def __init__(self, path, max_idle=MAX_IDLE_CONNECTIONS):
+        self.path = path
+        self._idle = queue.LifoQueue(maxsize=max_idle)
+        self._local = threading.local()
+
+    @contextmanager
+    def connection(self):
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            yield held
+            return
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = connect(self.path)
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._release(conn)
+
+    def _release(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback()  # never hand out a connection mid-transaction
+            self._idle.put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """connection() that commits on success and rolls back on error"""
+        with self.connection() as conn:
+            with conn:
+                yield conn
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(path):
+    """Process-wide connection pool for a database file"""
+    key = os.path.abspath(path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(path)
+        return pool
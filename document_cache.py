@@ -0,0 +1,48 @@
+import hashlib
+
+from cache import get_cache, make_key
+
+
+# Extracted resume text is personal data: keep it only briefly
+EXTRACT_CACHE_MEMORY_ENTRIES = 64
+EXTRACT_CACHE_DISK_ENTRIES = 1000
+EXTRACT_CACHE_TTL_SECONDS = 24 * 3600
+# Bump when extraction output changes so stale text isn't served
+# (3: earlier entries may hold PDFs with a failed worker's pages missing)
+EXTRACTOR_VERSION = 3
+
+
+def read_upload(file):
+    """Bytes of an uploaded file, file object or path"""
+    if isinstance(file, (bytes, bytearray)):
+        return bytes(file)
+    if isinstance(file, str):
+        with open(file, "rb") as f:
+            return f.read()
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    return file.read()
+
+
+def get_extraction_cache():
+    """Extracted document text by content hash (memory LRU in front of SQLite)"""
+    return get_cache("extracted_text", memory_entries=EXTRACT_CACHE_MEMORY_ENTRIES,
+                     disk_entries=EXTRACT_CACHE_DISK_ENTRIES, ttl_seconds=EXTRACT_CACHE_TTL_SECONDS)
+
+
+def cached_extract(kind, file, extract):
+    """extract(data) for the file's bytes, memoized by a hash of those bytes.
+
+    Streamlit reruns the page on every interaction while a file stays
+    uploaded; this makes every run after the first a lookup. Only complete
+    extractions are stored: extract must raise (e.g. PDFExtractionError)
+    rather than return partial text.
+    """
+    data = read_upload(file)
+    key = make_key(kind, EXTRACTOR_VERSION, hashlib.sha256(data).hexdigest())
+    cache = get_extraction_cache()
+    text = cache.get(key)
+    if text is None:
+        text = extract(data)
+        cache.set(key, text)
+    return text
@@ -0,0 +1,98 @@
+import io
+import zipfile
+import xml.etree.ElementTree as ET
+
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+DOCUMENT_PART = "word/document.xml"
+CELL_SEPARATOR = " | "
+
+
+def _open_document_part(file):
+    if isinstance(file, (bytes, bytearray)):
+        file = io.BytesIO(file)
+    archive = zipfile.ZipFile(file)
+    return archive, archive.open(DOCUMENT_PART)
+
+
+def iter_docx_text(file):
+    """Yield the text of a .docx one line at a time, in document order, without building a DOM.
+
+    word/document.xml is read with iterparse and every element is dropped once
+    handled, so memory stays flat however large the file is. Paragraphs give
+    one line each, table rows one line with cells joined by CELL_SEPARATOR, and
+    text boxes (which Word stores twice, as a drawing and a VML fallback) give
+    their paragraphs once.
+    """
+    archive, part = _open_document_part(file)
+    paragraphs = []  # text boxes nest paragraphs inside paragraphs
+    rows = []  # tables nest too: each row is a list of cell texts
+    cells = []
+    fallback_depth = 0
+    body = None
+    depth = 0
+    try:
+        for event, elem in ET.iterparse(part, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                depth += 1
+                if tag == W + "body":
+                    body = elem
+                elif tag == MC + "Fallback":
+                    fallback_depth += 1
+                elif fallback_depth:
+                    pass
+                elif tag == W + "p":
+                    paragraphs.append([])
+                elif tag == W + "tr":
+                    rows.append([])
+                elif tag == W + "tc":
+                    cells.append([])
+                continue
+
+            depth -= 1
+            if tag == MC + "Fallback":
+                fallback_depth -= 1
+            elif fallback_depth:
+                pass
+            elif tag == W + "t":
+                if paragraphs and elem.text:
+                    paragraphs[-1].append(elem.text)
+            elif tag == W + "tab":
+                if paragraphs:
+                    paragraphs[-1].append("\t")
+            elif tag in (W + "br", W + "cr"):
+                if paragraphs:
+                    paragraphs[-1].append("\n")
+            elif tag == W + "p":
+                text = "".join(paragraphs.pop())
+                if cells:
+                    cells[-1].append(text)
+                elif text.strip():
+                    yield text
+            elif tag == W + "tc":
+                text = " ".join(t for t in cells.pop() if t.strip())
+                if rows:
+                    rows[-1].append(text)
+            elif tag == W + "tr":
+                row = [c for c in rows.pop() if c]
+                if not row:
+                    pass
+                elif cells:  # nested table: fold the row into the enclosing cell
+                    cells[-1].append(CELL_SEPARATOR.join(row))
+                else:
+                    yield CELL_SEPARATOR.join(row)
+
+            elem.clear()
+            if depth == 2 and body is not None:
+                # Top-level block finished: detach it so the tree never grows
+                body.remove(elem)
+    finally:
+        part.close()
+        archive.close()
+
+
+def extract_docx_text(file):
+    """Whole-document text, one paragraph or table row per line"""
+    return "\n".join(iter_docx_text(file))
@@ -0,0 +1,162 @@
+import collections
+import threading
+import time
+
+from cache import get_cache, make_key
+from rate_limiter import get_rate_limiter, backoff_delay, MAX_RETRIES, PRIORITY_INTERACTIVE
+from resume_compress import estimate_tokens
+
+
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600
+LLM_CACHE_MAX_ENTRIES = 5000
+
+# HTTP pool limits for each client
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY_SECONDS = 120
+REQUEST_TIMEOUT_SECONDS = 60
+# Distinct API keys kept warm at once (users may paste their own keys)
+MAX_CLIENTS = 32
+# Besides 5xx, the statuses the SDK's default retry policy treats as transient
+RETRY_STATUS_CODES = (408, 409, 429)
+
+_clients = collections.OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def _new_client(api_key):
+    # groq/httpx take ~0.2s to import; pay for it on the first real call, not at page load
+    import httpx
+    from groq import Groq, DefaultHttpxClient
+
+    http_client = DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=REQUEST_TIMEOUT_SECONDS,
+    )
+    # Retries go through _create and the key's rate limiter instead of the SDK's own loop
+    return Groq(api_key=api_key, http_client=http_client, max_retries=0)
+
+
+def get_groq_client(api_key):
+    """Process-wide Groq client for this API key, reusing its keep-alive connection pool"""
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _new_client(api_key)
+            _clients[api_key] = client
+            while len(_clients) > MAX_CLIENTS:
+                # Not closed here: another session may still be mid-request on it
+                _clients.popitem(last=False)
+        else:
+            _clients.move_to_end(api_key)
+        return client
+
+
+def get_llm_cache():
+    """Persistent cache of LLM replies (SQLite, TTL + LRU eviction)"""
+    return get_cache("llm_responses", disk_entries=LLM_CACHE_MAX_ENTRIES, ttl_seconds=LLM_CACHE_TTL_SECONDS)
+
+
+def _retry_after(error):
+    try:
+        return float(error.response.headers["retry-after"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _is_retryable(error):
+    """429s, timeouts/conflicts, server errors and dropped connections (what the SDK itself would retry)"""
+    from groq import APIConnectionError, APIStatusError
+
+    if isinstance(error, APIConnectionError):
+        return True
+    return isinstance(error, APIStatusError) and (error.status_code in RETRY_STATUS_CODES or error.status_code >= 500)
+
+
+def _create(api_key, prompt, max_tokens, priority, **kwargs):
+    """chat.completions.create under the key's rate limiter, retrying transient errors with jittered backoff.
+
+    A 429 pauses every caller on the key; other retryable errors only delay
+    this call. Returns (response, estimated_tokens) so the caller can settle
+    real usage.
+    """
+    from groq import APIError, RateLimitError
+
+    limiter = get_rate_limiter(api_key)
+    estimated = estimate_tokens(prompt) + max_tokens
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire(estimated, priority)
+        try:
+            response = get_groq_client(api_key).chat.completions.create(
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                **kwargs
+            )
+            return response, estimated
+        except APIError as e:
+            limiter.settle(estimated, 0)
+            if attempt == MAX_RETRIES or not _is_retryable(e):
+                raise
+            if isinstance(e, RateLimitError):
+                limiter.pause(backoff_delay(attempt, _retry_after(e)))
+            else:
+                time.sleep(backoff_delay(attempt, _retry_after(e)))
+
+
+def chat_completion(prompt, api_key, max_tokens=1000, temperature=0.7, model=DEFAULT_MODEL, use_cache=True,
+                    refresh=False, priority=PRIORITY_INTERACTIVE):
+    """Single-prompt chat completion, answered from the LLM cache when the same request was seen before.
+
+    refresh=True skips the lookup but still overwrites the cached reply. Calls
+    that reach Groq share their API key's rate limiter, served by priority.
+    """
+    key = make_key(prompt, model, temperature, max_tokens)
+    if use_cache and not refresh:
+        cached = get_llm_cache().get(key)
+        if cached is not None:
+            return cached
+
+    response, estimated = _create(api_key, prompt, max_tokens, priority, model=model, temperature=temperature)
+    if getattr(response, "usage", None) is not None:
+        get_rate_limiter(api_key).settle(estimated, response.usage.total_tokens)
+    content = response.choices[0].message.content
+    if use_cache and content:
+        get_llm_cache().set(key, content)
+    return content
+
+
+def remember_reply(prompt, content, max_tokens=1000, temperature=0.7, model=DEFAULT_MODEL):
+    """Store (or replace) the cached reply for a request, e.g. after repairing it"""
+    get_llm_cache().set(make_key(prompt, model, temperature, max_tokens), content)
+
+
+def stream_chat_completion(prompt, api_key, max_tokens=1000, temperature=0.7, model=DEFAULT_MODEL, use_cache=True,
+                           priority=PRIORITY_INTERACTIVE):
+    """Like chat_completion, but yields the reply in chunks as Groq streams it.
+
+    A cached reply is yielded in one piece; a completed stream is cached under
+    the same key as the non-streaming call.
+    """
+    key = make_key(prompt, model, temperature, max_tokens)
+    if use_cache:
+        cached = get_llm_cache().get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    stream, _ = _create(api_key, prompt, max_tokens, priority, model=model, temperature=temperature, stream=True)
+    parts = []
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            parts.append(delta)
+            yield delta
+
+    content = "".join(parts)
+    if use_cache and content:
+        get_llm_cache().set(key, content)
@@ -0,0 +1,128 @@
+import io
+import time
+import tokenize
+
+
+SUBMISSION_MODULE = '__submission__'
+
+
+def normalize_code(code):
+    """Strip comments and trailing whitespace so cosmetic edits hash the same.
+
+    Every line is kept, blank or not, because cached results quote line
+    numbers (SyntaxError messages, profiler labels). Lines inside a
+    multi-line string keep their trailing spaces. Code that does not
+    tokenize is returned unchanged.
+    """
+    code = code.replace("\r\n", "\n")
+    lines = code.split("\n")
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(code).readline))
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        return code
+    comments = {}  # row -> column where its comment starts
+    in_token = set()  # rows whose line break is inside a multi-line token
+    for tok in tokens:
+        if tok.type == tokenize.COMMENT:
+            comments[tok.start[0]] = tok.start[1]
+        elif tok.end[0] > tok.start[0] and tok.type not in (tokenize.NL, tokenize.NEWLINE):
+            in_token.update(range(tok.start[0], tok.end[0]))
+    kept = []
+    for row, line in enumerate(lines, 1):
+        if row in comments:
+            line = line[:comments[row]]
+        kept.append(line if row in in_token else line.rstrip())
+    return "\n".join(kept)
+
+
+def compile_submission(code):
+    """Compile and execute the submission once, returning its namespace"""
+    compiled = compile(code, '<submission>', 'exec')
+    namespace = {'__builtins__': __builtins__, '__name__': SUBMISSION_MODULE}
+    exec(compiled, namespace)
+    return namespace
+
+
+def find_entry_function(namespace):
+    """Get the entry function (first callable defined by the submission itself, not imported)"""
+    for value in namespace.values():
+        if callable(value) and getattr(value, '__module__', None) == SUBMISSION_MODULE:
+            return value
+    return None
+
+
+def load_entry_function(code):
+    """Compile the submission and resolve its entry function, raising if there is none"""
+    func = find_entry_function(compile_submission(code))
+    if func is None:
+        raise ValueError('No function found in code')
+    return func
+
+
+def call_entry(func, input_data):
+    """Call the entry function with a test input (dicts are unpacked as keyword arguments)"""
+    if isinstance(input_data, dict):
+        return func(**input_data)
+    return func(input_data)
+
+
+def outputs_match(actual, expected):
+    """actual == expected as a plain bool (a returned object's __eq__ may return anything, or raise)"""
+    try:
+        return bool(actual == expected)
+    except Exception:
+        return False
+
+
+def run_test_case(func, test, test_num):
+    """Run a single test case against an already resolved entry function"""
+    input_data = test['input']
+    expected = test['expected']
+    start = time.perf_counter()
+    try:
+        actual = call_entry(func, input_data)
+        error = None
+    except BaseException as e:
+        actual = None
+        error = str(e) or type(e).__name__
+    duration_ms = (time.perf_counter() - start) * 1000
+
+    result = {
+        'test_num': test_num,
+        'passed': error is None and outputs_match(actual, expected),
+        'input': input_data,
+        'expected': expected,
+        'duration_ms': round(duration_ms, 3),
+        'error': error
+    }
+    if error is None:
+        result['actual'] = actual
+    return result
+
+
+def iter_test_results(code, test_cases, first_test_num=1):
+    """Compile once, resolve the entry function once, then yield one result per test case"""
+    try:
+        func = load_entry_function(code)
+    except BaseException as e:
+        error = str(e) or type(e).__name__
+        if isinstance(e, SyntaxError):
+            error = f"SyntaxError: {e.msg} (line {e.lineno})"
+        for offset, test in enumerate(test_cases):
+            yield {
+                'test_num': first_test_num + offset,
+                'passed': False,
+                'input': test.get('input'),
+                'expected': test.get('expected'),
+                'duration_ms': 0.0,
+                'error': error
+            }
+        return
+
+    for offset, test in enumerate(test_cases):
+        yield run_test_case(func, test, first_test_num + offset)
+
+
+def run_test_batch(code, test_cases):
+    """Run every test case in one batch (in-process, no sandboxing)"""
+    return list(iter_test_results(code, test_cases))
@@ -0,0 +1,108 @@
+import json
+
+
+class IncrementalJSONObject:
+    """Parse a JSON object that arrives in chunks (e.g. streamed LLM output).
+
+    Top-level fields show up in `fields` as soon as their value is complete, and
+    `partial` holds (key, text so far) for a string value still being streamed.
+    Any prose before the opening brace is ignored.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.fields = {}
+        self.partial = None
+        self.done = False
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_start = None
+        self._key = None
+        self._value_start = None
+
+    def feed(self, chunk):
+        """Consume more text and return the names of fields completed by it"""
+        self.text += chunk
+        completed = []
+        text = self.text
+        while self._pos < len(text) and not self.done:
+            ch = text[self._pos]
+            if self._depth == 0:
+                if ch == '{':
+                    self._depth = 1
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._reading_key():
+                        self._key = self._loads(text[self._key_start:self._pos + 1])
+            elif ch == '"':
+                self._in_string = True
+                if self._reading_key():
+                    self._key_start = self._pos
+            elif ch == ':' and self._depth == 1 and self._key is not None and self._value_start is None:
+                self._value_start = self._pos + 1
+            elif ch in '{[':
+                self._depth += 1
+            elif ch in ']}':
+                if self._depth == 1 and ch == '}':
+                    self._finish_value(text, completed)
+                    self.done = True
+                self._depth -= 1
+            elif ch == ',' and self._depth == 1:
+                self._finish_value(text, completed)
+            self._pos += 1
+
+        self._update_partial(text)
+        return completed
+
+    def _reading_key(self):
+        return self._depth == 1 and self._key is None and self._value_start is None
+
+    def _finish_value(self, text, completed):
+        if self._key is not None and self._value_start is not None:
+            value = self._loads(text[self._value_start:self._pos].strip())
+            if value is not _INVALID:
+                self.fields[self._key] = value
+                completed.append(self._key)
+        self._key = None
+        self._key_start = None
+        self._value_start = None
+        self.partial = None
+
+    def _update_partial(self, text):
+        self.partial = None
+        if self._key is None or self._value_start is None or self._depth != 1 or not self._in_string:
+            return
+        raw = text[self._value_start:].lstrip()
+        if raw.startswith('"'):
+            raw = raw[1:]
+            if raw.endswith('\\'):
+                raw = raw[:-1]
+            value = self._loads('"' + raw + '"')
+            if value is not _INVALID:
+                self.partial = (self._key, value)
+
+    @staticmethod
+    def _loads(raw):
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return _INVALID
+
+    def result(self):
+        """The whole object if it parses, otherwise the fields completed so far"""
+        start, end = self.text.find('{'), self.text.rfind('}') + 1
+        if start != -1 and end > start:
+            value = self._loads(self.text[start:end])
+            if isinstance(value, dict):
+                return value
+        return dict(self.fields)
+
+
+_INVALID = object()
@@ -1,13 +1,19 @@
 import streamlit as st
-import sqlite3
 import time
 from datetime import datetime, timedelta
-import subprocess
-import sys
-import io
-from contextlib import redirect_stdout, redirect_stderr
-from groq import Groq
+from contextlib import contextmanager
+from code_assessment import assess_code_with_ai
 import json
+from sandbox import get_sandbox_pool, run_tests_in_sandbox, SandboxError
+from profiler import iter_profile
+from complexity import estimate_complexity, format_complexity_report
+from stress import has_generator, input_maker, complexity_max_size, run_stress_test
+from submission_queue import get_submission_queue, QueueFull
+from cache import get_cache, make_key
+from harness import normalize_code
+from db import get_pool, QUESTIONS_DB
+from question_catalog import get_question_catalog
+import uuid
 
 # Page config
 st.set_page_config(
@@ -33,243 +39,223 @@ if 'user_code' not in st.session_state:
     st.session_state.user_code = ""
 if 'use_remote_db' not in st.session_state:
     st.session_state.use_remote_db = False
+if 'candidate_id' not in st.session_state:
+    st.session_state.candidate_id = uuid.uuid4().hex
+if 'pending_job' not in st.session_state:
+    st.session_state.pending_job = None
 
 # Database functions
+def use_turso(turso_url=None, turso_token=None):
+    return bool(turso_url and turso_token and st.session_state.use_remote_db)
+
+@contextmanager
 def get_db_connection(turso_url=None, turso_token=None):
-    """Get database connection - local SQLite or remote Turso"""
-    if turso_url and turso_token and st.session_state.use_remote_db:
+    """Database connection for a with-block - remote Turso, or a pooled local SQLite connection"""
+    if use_turso(turso_url, turso_token):
         try:
             from libsql_experimental import dbapi2 as libsql
             conn = libsql.connect(database=turso_url, auth_token=turso_token)
-            return conn
         except Exception as e:
             st.error(f"Turso connection error: {e}")
-            # Fallback to local
-            return sqlite3.connect('coding_questions.db')
-    else:
-        return sqlite3.connect('coding_questions.db')
+            conn = None
+        if conn is not None:
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+    # Local (also the fallback when Turso is unreachable)
+    with get_pool(QUESTIONS_DB).connection() as conn:
+        yield conn
 
 def init_database(turso_url=None, turso_token=None):
     """Initialize database with coding questions"""
-    conn = get_db_connection(turso_url, turso_token)
-    cursor = conn.cursor()
-
-    # Create table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS questions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            difficulty TEXT NOT NULL,
-            category TEXT NOT NULL,
-            description TEXT NOT NULL,
-            starter_code TEXT,
-            test_cases TEXT,
-            solution TEXT,
-            time_complexity TEXT,
-            space_complexity TEXT
-        )
-    ''')
-
-    # Check if table is empty
-    cursor.execute('SELECT COUNT(*) FROM questions')
-    if cursor.fetchone()[0] == 0:
-        # Insert sample questions
-        sample_questions = [
-            (
-                "Two Sum",
-                "Easy",
-                "Arrays",
-                "Given an array of integers nums and an integer target, return indices of the two numbers such that they add up to target. You may assume that each input would have exactly one solution, and you may not use the same element twice.",
-                "def two_sum(nums, target):\n    # Write your code here\n    pass",
-                '[{"input": {"nums": [2,7,11,15], "target": 9}, "expected": [0,1]}, {"input": {"nums": [3,2,4], "target": 6}, "expected": [1,2]}, {"input": {"nums": [3,3], "target": 6}, "expected": [0,1]}]',
-                "def two_sum(nums, target):\n    seen = {}\n    for i, num in enumerate(nums):\n        complement = target - num\n        if complement in seen:\n            return [seen[complement], i]\n        seen[num] = i\n    return []",
-                "O(n)",
-                "O(n)"
-            ),
-            (
-                "Reverse String",
-                "Easy",
-                "Strings",
-                "Write a function that reverses a string. The input string is given as an array of characters s. You must do this by modifying the input array in-place with O(1) extra memory.",
-                "def reverse_string(s):\n    # Write your code here\n    pass",
-                '[{"input": {"s": ["h","e","l","l","o"]}, "expected": ["o","l","l","e","h"]}, {"input": {"s": ["H","a","n","n","a","h"]}, "expected": ["h","a","n","n","a","H"]}]',
-                "def reverse_string(s):\n    left, right = 0, len(s) - 1\n    while left < right:\n        s[left], s[right] = s[right], s[left]\n        left += 1\n        right -= 1",
-                "O(n)",
-                "O(1)"
-            ),
-            (
-                "Valid Palindrome",
-                "Easy",
-                "Strings",
-                "A phrase is a palindrome if, after converting all uppercase letters into lowercase letters and removing all non-alphanumeric characters, it reads the same forward and backward. Given a string s, return true if it is a palindrome, or false otherwise.",
-                "def is_palindrome(s):\n    # Write your code here\n    pass",
-                '[{"input": {"s": "A man, a plan, a canal: Panama"}, "expected": true}, {"input": {"s": "race a car"}, "expected": false}, {"input": {"s": " "}, "expected": true}]',
-                "def is_palindrome(s):\n    cleaned = ''.join(c.lower() for c in s if c.isalnum())\n    return cleaned == cleaned[::-1]",
-                "O(n)",
-                "O(n)"
-            ),
-            (
-                "Fibonacci Number",
-                "Easy",
-                "Dynamic Programming",
-                "The Fibonacci numbers, commonly denoted F(n) form a sequence, such that each number is the sum of the two preceding ones, starting from 0 and 1. Given n, calculate F(n).",
-                "def fibonacci(n):\n    # Write your code here\n    pass",
-                '[{"input": {"n": 2}, "expected": 1}, {"input": {"n": 3}, "expected": 2}, {"input": {"n": 4}, "expected": 3}, {"input": {"n": 10}, "expected": 55}]',
-                "def fibonacci(n):\n    if n <= 1:\n        return n\n    a, b = 0, 1\n    for _ in range(2, n + 1):\n        a, b = b, a + b\n    return b",
-                "O(n)",
-                "O(1)"
-            ),
-            (
-                "Binary Search",
-                "Medium",
-                "Binary Search",
-                "Given an array of integers nums which is sorted in ascending order, and an integer target, write a function to search target in nums. If target exists, then return its index. Otherwise, return -1.",
-                "def binary_search(nums, target):\n    # Write your code here\n    pass",
-                '[{"input": {"nums": [-1,0,3,5,9,12], "target": 9}, "expected": 4}, {"input": {"nums": [-1,0,3,5,9,12], "target": 2}, "expected": -1}]',
-                "def binary_search(nums, target):\n    left, right = 0, len(nums) - 1\n    while left <= right:\n        mid = (left + right) // 2\n        if nums[mid] == target:\n            return mid\n        elif nums[mid] < target:\n            left = mid + 1\n        else:\n            right = mid - 1\n    return -1",
-                "O(log n)",
-                "O(1)"
+    with get_db_connection(turso_url, turso_token) as conn:
+        cursor = conn.cursor()
+
+        # Create table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS questions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                difficulty TEXT NOT NULL,
+                category TEXT NOT NULL,
+                description TEXT NOT NULL,
+                starter_code TEXT,
+                test_cases TEXT,
+                solution TEXT,
+                time_complexity TEXT,
+                space_complexity TEXT
             )
-        ]
-
-        cursor.executemany('''
-            INSERT INTO questions (title, difficulty, category, description, starter_code, test_cases, solution, time_complexity, space_complexity)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', sample_questions)
+        ''')
+
+        # Check if table is empty
+        cursor.execute('SELECT COUNT(*) FROM questions')
+        if cursor.fetchone()[0] == 0:
+            # Insert sample questions
+            sample_questions = [
+                (
+                    "Two Sum",
+                    "Easy",
+                    "Arrays",
+                    "Given an array of integers nums and an integer target, return indices of the two numbers such that they add up to target. You may assume that each input would have exactly one solution, and you may not use the same element twice.",
+                    "def two_sum(nums, target):\n    # Write your code here\n    pass",
+                    '[{"input": {"nums": [2,7,11,15], "target": 9}, "expected": [0,1]}, {"input": {"nums": [3,2,4], "target": 6}, "expected": [1,2]}, {"input": {"nums": [3,3], "target": 6}, "expected": [0,1]}]',
+                    "def two_sum(nums, target):\n    seen = {}\n    for i, num in enumerate(nums):\n        complement = target - num\n        if complement in seen:\n            return [seen[complement], i]\n        seen[num] = i\n    return []",
+                    "O(n)",
+                    "O(n)"
+                ),
+                (
+                    "Reverse String",
+                    "Easy",
+                    "Strings",
+                    "Write a function that reverses a string. The input string is given as an array of characters s. You must do this by modifying the input array in-place with O(1) extra memory.",
+                    "def reverse_string(s):\n    # Write your code here\n    pass",
+                    '[{"input": {"s": ["h","e","l","l","o"]}, "expected": ["o","l","l","e","h"]}, {"input": {"s": ["H","a","n","n","a","h"]}, "expected": ["h","a","n","n","a","H"]}]',
+                    "def reverse_string(s):\n    left, right = 0, len(s) - 1\n    while left < right:\n        s[left], s[right] = s[right], s[left]\n        left += 1\n        right -= 1",
+                    "O(n)",
+                    "O(1)"
+                ),
+                (
+                    "Valid Palindrome",
+                    "Easy",
+                    "Strings",
+                    "A phrase is a palindrome if, after converting all uppercase letters into lowercase letters and removing all non-alphanumeric characters, it reads the same forward and backward. Given a string s, return true if it is a palindrome, or false otherwise.",
+                    "def is_palindrome(s):\n    # Write your code here\n    pass",
+                    '[{"input": {"s": "A man, a plan, a canal: Panama"}, "expected": true}, {"input": {"s": "race a car"}, "expected": false}, {"input": {"s": " "}, "expected": true}]',
+                    "def is_palindrome(s):\n    cleaned = ''.join(c.lower() for c in s if c.isalnum())\n    return cleaned == cleaned[::-1]",
+                    "O(n)",
+                    "O(n)"
+                ),
+                (
+                    "Fibonacci Number",
+                    "Easy",
+                    "Dynamic Programming",
+                    "The Fibonacci numbers, commonly denoted F(n) form a sequence, such that each number is the sum of the two preceding ones, starting from 0 and 1. Given n, calculate F(n).",
+                    "def fibonacci(n):\n    # Write your code here\n    pass",
+                    '[{"input": {"n": 2}, "expected": 1}, {"input": {"n": 3}, "expected": 2}, {"input": {"n": 4}, "expected": 3}, {"input": {"n": 10}, "expected": 55}]',
+                    "def fibonacci(n):\n    if n <= 1:\n        return n\n    a, b = 0, 1\n    for _ in range(2, n + 1):\n        a, b = b, a + b\n    return b",
+                    "O(n)",
+                    "O(1)"
+                ),
+                (
+                    "Binary Search",
+                    "Medium",
+                    "Binary Search",
+                    "Given an array of integers nums which is sorted in ascending order, and an integer target, write a function to search target in nums. If target exists, then return its index. Otherwise, return -1.",
+                    "def binary_search(nums, target):\n    # Write your code here\n    pass",
+                    '[{"input": {"nums": [-1,0,3,5,9,12], "target": 9}, "expected": 4}, {"input": {"nums": [-1,0,3,5,9,12], "target": 2}, "expected": -1}]',
+                    "def binary_search(nums, target):\n    left, right = 0, len(nums) - 1\n    while left <= right:\n        mid = (left + right) // 2\n        if nums[mid] == target:\n            return mid\n        elif nums[mid] < target:\n            left = mid + 1\n        else:\n            right = mid - 1\n    return -1",
+                    "O(log n)",
+                    "O(1)"
+                )
+            ]
+
+            cursor.executemany('''
+                INSERT INTO questions (title, difficulty, category, description, starter_code, test_cases, solution, time_complexity, space_complexity)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', sample_questions)
+
+            conn.commit()
 
-        conn.commit()
-
-    conn.close()
     st.session_state.db_initialized = True
 
 def get_all_questions(turso_url=None, turso_token=None):
     """Retrieve all questions from database"""
-    conn = get_db_connection(turso_url, turso_token)
-    cursor = conn.cursor()
-    cursor.execute('SELECT id, title, difficulty, category FROM questions')
-    questions = cursor.fetchall()
-    conn.close()
-    return questions
+    if not use_turso(turso_url, turso_token):
+        return get_question_catalog().summaries()
+    with get_db_connection(turso_url, turso_token) as conn:
+        return conn.execute('SELECT id, title, difficulty, category FROM questions').fetchall()
 
 def get_question_by_id(question_id, turso_url=None, turso_token=None):
     """Retrieve specific question by ID"""
-    conn = get_db_connection(turso_url, turso_token)
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM questions WHERE id = ?', (question_id,))
-    question = cursor.fetchone()
-    conn.close()
-    return question
-
-
-def run_python_code(code, test_cases):
-    """Execute Python code with test cases"""
-    results = []
-
-    for idx, test in enumerate(test_cases):
+    if not use_turso(turso_url, turso_token):
+        return get_question_catalog().question(question_id)
+    with get_db_connection(turso_url, turso_token) as conn:
+        return conn.execute('SELECT * FROM questions WHERE id = ?', (question_id,)).fetchone()
+
+def get_question_test_cases(question, turso_url=None, turso_token=None):
+    """Parsed test cases for a question row; local ones come pre-parsed from the catalog"""
+    test_cases = None
+    if not use_turso(turso_url, turso_token):
+        test_cases = get_question_catalog().test_cases(question[0])
+    return test_cases if test_cases is not None else json.loads(question[6])
+
+
+def run_python_code(code, test_cases, profile=False):
+    """Execute Python code with test cases in the sandbox worker pool.
+
+    Returns (results, hotspots); with profile=True the entry function is also
+    run under cProfile on the largest test input, otherwise hotspots is None.
+    """
+    results = run_tests_in_sandbox(code, test_cases)
+    hotspots = None
+    if profile and test_cases:
         try:
-            # Create a safe execution environment
-            local_vars = {}
-            global_vars = {'__builtins__': __builtins__}
-
-            # Execute the user's code
-            exec(code, global_vars, local_vars)
-
-            # Get the function name (assume first function defined)
-            func_name = None
-            for key, value in local_vars.items():
-                if callable(value):
-                    func_name = key
-                    break
-
-            if not func_name:
-                results.append({
-                    'test_num': idx + 1,
-                    'passed': False,
-                    'error': 'No function found in code'
-                })
-                continue
-
-            # Run the test
-            func = local_vars[func_name]
-            input_data = test['input']
-            expected = test['expected']
-
-            # Call function with unpacked arguments
-            if isinstance(input_data, dict):
-                actual = func(**input_data)
-            else:
-                actual = func(input_data)
-
-            # Compare results
-            passed = actual == expected
-            results.append({
-                'test_num': idx + 1,
-                'passed': passed,
-                'input': input_data,
-                'expected': expected,
-                'actual': actual,
-                'error': None
-            })
-
-        except Exception as e:
-            results.append({
-                'test_num': idx + 1,
-                'passed': False,
-                'error': str(e)
-            })
+            hotspots = get_sandbox_pool().run(iter_profile, (code, test_cases))[0]
+        except SandboxError:
+            # The failing input already shows up in the test results
+            hotspots = []
+    return results, hotspots
 
-    return results
 
+def submission_key(code, question_id, test_cases_json):
+    """Content hash of the normalized code, the question and its test-case version"""
+    return make_key(normalize_code(code), question_id, make_key(test_cases_json))
 
-def assess_code_with_ai(question_desc, user_code, test_results, api_key):
-    """Use Groq AI to assess the code quality and approach"""
-    passed_tests = sum(1 for r in test_results if r['passed'])
-    total_tests = len(test_results)
 
-    prompt = f"""You are an expert coding interviewer. Assess the following coding solution:
+def run_tests_cached(code, test_cases, cache_key, profile=False):
+    """Run the tests and remember the results, unless the sandbox cut a test short"""
+    results, hotspots = run_python_code(code, test_cases, profile)
+    update = {'test_results': results, 'profile_report': hotspots}
+    if all(r.get('duration_ms') is not None for r in results):
+        get_cache('submissions').set(f"tests:{profile}:{cache_key}", update)
+    return update
 
-Question: {question_desc}
 
-Candidate's Code:
-```python
-{user_code}
-```
+def run_stress_job(code, solution_code, title):
+    return {'stress_results': run_stress_test(code, solution_code, title)}
 
-Test Results: {passed_tests}/{total_tests} tests passed
 
-Provide assessment in JSON format:
-{{
-    "correctness_score": <1-10>,
-    "code_quality_score": <1-10>,
-    "efficiency_score": <1-10>,
-    "overall_score": <1-10>,
-    "strengths": ["..."],
-    "weaknesses": ["..."],
-    "suggestions": ["..."],
-    "verdict": "Pass/Fail/Borderline"
-}}
+def run_complexity_job(code, test_cases, time_comp, space_comp, title, cache_key):
+    """Measure complexity on the queue; the AI review picks it up on the next rerun"""
+    report = estimate_complexity(code, test_cases, time_comp, space_comp,
+                                 input_maker(title) if has_generator(title) else None,
+                                 max_size=complexity_max_size(title))
+    return {'complexity_report': report, 'assessment_key': cache_key}
 
-Focus on: correctness, code quality, time/space complexity, edge cases, readability.
-"""
 
+def submit_job(func, *args):
+    """Put a submission on the shared queue; results are collected by poll_job on later reruns"""
     try:
-        client = Groq(api_key=api_key)
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=1500,
-            temperature=0.3
-        )
+        job_id = get_submission_queue().submit(st.session_state.candidate_id, func, *args)
+        st.session_state.pending_job = job_id
+        return True
+    except QueueFull as e:
+        st.warning(f"⏳ {e}")
+        return False
+
+
+def poll_job():
+    """Check the pending submission and store its result in session state once finished"""
+    job_id = st.session_state.pending_job
+    status = get_submission_queue().status(job_id)
+
+    if status['state'] == 'done':
+        # Jobs return the session state keys they produce
+        st.session_state.update(status['result'])
+        st.session_state.pending_job = None
+        get_submission_queue().forget(job_id)
+        st.rerun()
+    elif status['state'] in ('failed', 'unknown'):
+        st.error(f"Submission failed: {status.get('error') or 'job was lost, please run again'}")
+        st.session_state.pending_job = None
+        get_submission_queue().forget(job_id)
+    elif status['state'] == 'queued':
+        st.info(f"⏳ Submission queued (position {status['position']})...")
+    else:
+        st.info("⚙️ Running your code...")
 
-        result = response.choices[0].message.content
-        # Extract JSON
-        json_start = result.find('{')
-        json_end = result.rfind('}') + 1
-        json_str = result[json_start:json_end]
-        return json.loads(json_str)
-    except Exception as e:
-        st.error(f"Error in AI assessment: {e}")
-        return None
 
 # Timer functions
 def start_timer():
@@ -308,6 +294,9 @@ if not st.session_state.db_initialized:
 
     init_database(turso_url, turso_token)
 
+# Warm up the shared sandbox workers before the first submission
+get_sandbox_pool()
+
 # Main UI
 st.title("💻 Live Coding Interview")
 
@@ -356,6 +345,10 @@ with st.sidebar:
             st.session_state.timer_start = None
             st.session_state.timer_active = False
             st.session_state.test_results = []
+            st.session_state.stress_results = []
+            st.session_state.profile_report = None
+            st.session_state.pending_job = None
+            st.session_state.assessment_key = None
             st.rerun()
 
     st.markdown("---")
@@ -387,6 +380,7 @@ if not st.session_state.current_question:
 # Get current question details
 q = st.session_state.current_question
 question_id, title, difficulty, category, description, starter_code, test_cases_json, solution, time_comp, space_comp = q
+test_cases = get_question_test_cases(q, turso_url, turso_token)
 
 # Display question info
 col1, col2, col3 = st.columns([2, 1, 1])
@@ -420,7 +414,6 @@ with left_col:
 
     # Test cases preview
     with st.expander("🧪 View Test Cases"):
-        test_cases = json.loads(test_cases_json)
         for idx, test in enumerate(test_cases, 1):
             st.markdown(f"**Test {idx}:**")
             st.code(json.dumps(test, indent=2), language="json")
@@ -508,36 +501,80 @@ with right_col:
                     st.rerun()
 
     # Action buttons
-    btn_col1, btn_col2 = st.columns(2)
+    btn_col1, btn_col2, btn_col3 = st.columns(3)
 
     with btn_col1:
-        if st.button("▶️ Run Tests", type="primary", use_container_width=True):
+        profile_run = st.checkbox("🔬 Profile hot paths", help="Run the largest test input under a profiler")
+        if st.button("▶️ Run Tests", type="primary", use_container_width=True, disabled=bool(st.session_state.pending_job)):
             if user_code.strip():
-                with st.spinner("Running tests..."):
-                    test_cases = json.loads(test_cases_json)
-                    results = run_python_code(user_code, test_cases)
-                    st.session_state.test_results = results
-                    st.session_state.user_code = user_code
+                st.session_state.user_code = user_code
+                cache_key = submission_key(user_code, question_id, test_cases_json)
+                cached = get_cache('submissions').get(f"tests:{profile_run}:{cache_key}")
+                if cached is not None:
+                    st.session_state.update(cached)
+                    st.rerun()
+                elif submit_job(run_tests_cached, user_code, test_cases, cache_key, profile_run):
                     st.rerun()
             else:
                 st.error("Please write some code first!")
 
     with btn_col2:
-        if st.button("🤖 AI Assessment", use_container_width=True):
-            if st.session_state.test_results:
-                with st.spinner("AI is reviewing your code..."):
-                    assessment = assess_code_with_ai(
-                        description,
-                        user_code,
-                        st.session_state.test_results,
-                        groq_api_key
-                    )
-                    if assessment:
-                        st.session_state.ai_assessment = assessment
-                        st.rerun()
+        if st.button("🤖 AI Assessment", use_container_width=True, disabled=bool(st.session_state.pending_job)):
+            cache_key = submission_key(user_code, question_id, test_cases_json)
+            cached = get_cache('submissions').get(f"assessment:{cache_key}")
+            if st.session_state.test_results and cached is not None:
+                st.session_state.complexity_report, st.session_state.ai_assessment = cached
+                st.rerun()
+            elif st.session_state.test_results:
+                # Complexity runs on the sandbox queue; the review below starts once it is back
+                st.session_state.user_code = user_code
+                if submit_job(run_complexity_job, user_code, test_cases, time_comp, space_comp, title, cache_key):
+                    st.rerun()
             else:
                 st.warning("Please run tests first!")
 
+    with btn_col3:
+        if st.button("🔥 Stress Test", use_container_width=True,
+                     disabled=not has_generator(title) or bool(st.session_state.pending_job)):
+            if user_code.strip():
+                st.session_state.user_code = user_code
+                if submit_job(run_stress_job, user_code, solution, title):
+                    st.rerun()
+            else:
+                st.error("Please write some code first!")
+
+    if st.session_state.pending_job:
+        poll_job()
+    elif st.session_state.get('assessment_key'):
+        cache_key = st.session_state.assessment_key
+        st.session_state.assessment_key = None
+        live = st.empty()
+        live.info("AI is reviewing your code...")
+
+        def show_progress(fields, partial):
+            labels = [("correctness_score", "Correctness"), ("code_quality_score", "Code Quality"),
+                      ("efficiency_score", "Efficiency"), ("overall_score", "Overall")]
+            scores = " · ".join(f"**{label}:** {fields[key]}/10" for key, label in labels if key in fields)
+            verdict = f"\n\n**Verdict:** {fields['verdict']}" if 'verdict' in fields else ""
+            live.info((scores or "AI is reviewing your code...") + verdict)
+
+        assessment = assess_code_with_ai(
+            description,
+            st.session_state.user_code,
+            st.session_state.test_results,
+            groq_api_key,
+            st.session_state.complexity_report,
+            st.session_state.get('profile_report'),
+            on_progress=show_progress
+        )
+        if assessment:
+            st.session_state.ai_assessment = assessment
+            get_cache('submissions').set(
+                f"assessment:{cache_key}",
+                (st.session_state.complexity_report, assessment)
+            )
+            st.rerun()
+
 # Display test results
 if st.session_state.test_results:
     st.markdown("---")
@@ -555,14 +592,45 @@ if st.session_state.test_results:
             expanded=not result['passed']
         ):
             if result['passed']:
-                st.success("Test passed!")
+                st.success(f"Test passed! ({result.get('duration_ms', 0):.2f} ms)")
                 if 'input' in result:
                     st.code(f"Input: {result['input']}\nExpected: {result['expected']}\nActual: {result['actual']}")
             else:
-                st.error(f"Error: {result.get('error', 'Output mismatch')}")
+                st.error(f"Error: {result.get('error') or 'Output mismatch'}")
                 if 'input' in result:
                     st.code(f"Input: {result.get('input', 'N/A')}\nExpected: {result.get('expected', 'N/A')}\nActual: {result.get('actual', 'N/A')}")
 
+# Display profiler hotspots
+if st.session_state.get('profile_report'):
+    st.markdown("---")
+    st.subheader("🔬 Hot Paths (largest test input)")
+    st.table([
+        {
+            "Function": h['function'],
+            "Calls": h['calls'],
+            "Own (ms)": h['own_ms'],
+            "Cumulative (ms)": h['cumulative_ms'],
+        }
+        for h in st.session_state.profile_report
+    ])
+
+# Display stress test results
+if st.session_state.get('stress_results'):
+    st.markdown("---")
+    st.subheader("🔥 Stress Test (vs. reference solution)")
+
+    rows = []
+    for r in st.session_state.stress_results:
+        rows.append({
+            "Input size": f"{r['n']:,}",
+            "Result": ("✅ Match" if r['passed'] else f"⚠️ {r['error']}" if r['passed'] is None
+                       else f"❌ {r['error'] or 'Output mismatch'}"),
+            "Your time (ms)": round(r['candidate_seconds'] * 1000, 2) if r['candidate_seconds'] is not None else None,
+            "Reference (ms)": round(r['reference_seconds'] * 1000, 2) if r['reference_seconds'] is not None else None,
+            "Ratio": f"{r['ratio']:.1f}x" if r['ratio'] is not None else "—",
+        })
+    st.table(rows)
+
 # Display AI assessment
 if 'ai_assessment' in st.session_state:
     st.markdown("---")
@@ -591,6 +659,18 @@ if 'ai_assessment' in st.session_state:
     }
     st.markdown(f"### {verdict_colors.get(verdict, '⚪')} Verdict: **{verdict}**")
 
+    # Measured complexity
+    report = st.session_state.get('complexity_report')
+    if report and report['measurements']:
+        col_t, col_s = st.columns(2)
+        with col_t:
+            icon = '✅' if report['time_matches'] else '⚠️'
+            st.info(f"{icon} **Measured Time:** {report['time_class']} (expected {report['expected_time']})")
+        with col_s:
+            icon = '✅' if report['space_matches'] else '⚠️'
+            st.info(f"{icon} **Measured Space:** {report['space_class']} (expected {report['expected_space']})")
+        st.caption(format_complexity_report(report))
+
     # Detailed feedback
     col_a, col_b = st.columns(2)
 
@@ -616,7 +696,10 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Auto-refresh timer every second
-if st.session_state.timer_active:
+# Poll a queued submission quickly, otherwise auto-refresh timer every second
+if st.session_state.pending_job:
+    time.sleep(0.3)
+    st.rerun()
+elif st.session_state.timer_active:
     time.sleep(1)
     st.rerun()
\ No newline at end of file
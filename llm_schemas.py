@@ -0,0 +1,188 @@
+import json
+import re
+from typing import Annotated, List, Literal
+
+from pydantic import BaseModel, BeforeValidator, Field, ValidationError, field_validator
+
+from groq_client import chat_completion, remember_reply
+from json_stream import IncrementalJSONObject
+
+
+REPAIR_MAX_TOKENS = 300
+
+
+# Field coercions for the shapes LLMs actually return
+def _coerce_score(value):
+    """Accept 8, 8.4, "8", "8/10" or "Score: 8" for a 0-10 score"""
+    if isinstance(value, str):
+        match = re.search(r"-?\d+(\.\d+)?", value)
+        if not match:
+            return value
+        value = float(match.group())
+    if isinstance(value, float):
+        value = round(value)
+    return value
+
+
+def _coerce_list(value):
+    if isinstance(value, str):
+        return [value] if value.strip() else []
+    return value
+
+
+def _coerce_text(value):
+    if isinstance(value, list):
+        return "; ".join(str(v) for v in value)
+    return value
+
+
+Score = Annotated[int, BeforeValidator(_coerce_score), Field(ge=0, le=10)]
+TextList = Annotated[List[str], BeforeValidator(_coerce_list)]
+Text = Annotated[str, BeforeValidator(_coerce_text)]
+
+
+# Reply schemas
+class Strength(BaseModel):
+    strength: str
+    explanation: Text = ""
+
+
+class StrengthsReply(BaseModel):
+    strengths: List[Strength] = Field(min_length=1)
+
+
+class InterviewQuestion(BaseModel):
+    question: str
+    focus_area: str = "Technical"
+    difficulty: Literal["Easy", "Medium", "Hard"] = "Medium"
+
+    @field_validator("difficulty", mode="before")
+    @classmethod
+    def _capitalize(cls, value):
+        return value.strip().capitalize() if isinstance(value, str) else value
+
+
+class QuestionsReply(BaseModel):
+    questions: List[InterviewQuestion] = Field(min_length=1)
+
+
+class Evaluation(BaseModel):
+    score: Score
+    feedback: Text
+    strengths: Text = ""
+    improvements: Text = ""
+
+
+class CodeAssessment(BaseModel):
+    correctness_score: Score
+    code_quality_score: Score
+    efficiency_score: Score
+    overall_score: Score
+    strengths: TextList = []
+    weaknesses: TextList = []
+    suggestions: TextList = []
+    verdict: Literal["Pass", "Fail", "Borderline"]
+
+    @field_validator("verdict", mode="before")
+    @classmethod
+    def _capitalize(cls, value):
+        return value.strip().capitalize() if isinstance(value, str) else value
+
+
+# Tolerant parsing
+def _strip_fences(text):
+    return re.sub(r"```(?:json)?", "", text)
+
+
+def _loosen(raw):
+    """Fix the usual near-JSON mistakes: smart quotes, trailing commas, Python literals"""
+    raw = raw.replace("“", '"').replace("”", '"').replace("’", "'")
+    raw = re.sub(r",\s*([}\]])", r"\1", raw)
+    raw = re.sub(r"\bTrue\b", "true", raw)
+    raw = re.sub(r"\bFalse\b", "false", raw)
+    raw = re.sub(r"\bNone\b", "null", raw)
+    return raw
+
+
+def extract_json_object(text):
+    """Best-effort dict from an LLM reply; None if nothing object-like is in it"""
+    if not text:
+        return None
+    text = _strip_fences(text)
+    start, end = text.find('{'), text.rfind('}') + 1
+    if start != -1 and end > start:
+        for raw in (text[start:end], _loosen(text[start:end])):
+            try:
+                data = json.loads(raw, strict=False)
+                if isinstance(data, dict):
+                    return data
+            except ValueError:
+                pass
+    # Truncated or badly broken: keep whichever top-level fields did parse
+    parser = IncrementalJSONObject()
+    parser.feed(_loosen(text))
+    return dict(parser.fields) or None
+
+
+def validate_reply(data, schema):
+    """(instance, None) if data fits the schema, else (None, {field: error message})"""
+    if data is None:
+        return None, None
+    try:
+        return schema.model_validate(data), None
+    except ValidationError as e:
+        invalid = {}
+        for error in e.errors():
+            loc = [str(part) for part in error["loc"]]
+            field = loc[0] if loc else "__root__"
+            message = error["msg"] if len(loc) < 2 else f"{error['msg']} (at {'.'.join(loc)})"
+            invalid.setdefault(field, message)
+        return None, invalid
+
+
+def _repair_prompt(schema, data, invalid):
+    full = schema.model_json_schema()
+    fragment = {"properties": {f: full["properties"][f] for f in invalid if f in full.get("properties", {})}}
+    if "$defs" in full:
+        fragment["$defs"] = full["$defs"]
+    problems = "\n".join(f"- {field}: {message}" for field, message in invalid.items())
+    return f"""The following JSON has missing or invalid fields:
+{problems}
+
+JSON:
+{json.dumps(data, ensure_ascii=False)[:3000]}
+
+Return ONLY a JSON object containing corrected values for those fields, matching this schema:
+{json.dumps(fragment)}
+"""
+
+
+def parse_structured(response, schema, prompt=None, api_key=None, max_tokens=1000, temperature=0.7):
+    """Validate an LLM reply against a schema, fixing it as cheaply as possible.
+
+    1. tolerant local parse; 2. a small LLM call that re-emits only the invalid
+    fields; 3. regenerating the whole reply (last resort). Steps 2-3 need the
+    original prompt and api_key. Returns a schema instance or None.
+    """
+    data = extract_json_object(response)
+    result, invalid = validate_reply(data, schema)
+    if result or not api_key:
+        return result
+
+    try:
+        if data and invalid and "__root__" not in invalid:
+            fix = chat_completion(_repair_prompt(schema, data, invalid), api_key,
+                                  max_tokens=REPAIR_MAX_TOKENS, temperature=0, use_cache=False)
+            patch = extract_json_object(fix) or {}
+            result, _ = validate_reply({**data, **{k: v for k, v in patch.items() if k in invalid}}, schema)
+
+        if result is None and prompt:
+            response = chat_completion(prompt, api_key, max_tokens=max_tokens, temperature=temperature, refresh=True)
+            result, _ = validate_reply(extract_json_object(response), schema)
+    except Exception:
+        return None
+
+    if result is not None and prompt:
+        # Don't make the next cache hit pay for the same repair
+        remember_reply(prompt, result.model_dump_json(), max_tokens=max_tokens, temperature=temperature)
+    return result
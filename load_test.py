@@ -0,0 +1,173 @@
+"""End-to-end latency load test of the LLM-backed flows against the local mock server.
+
+Runs N virtual users through request_strengths, evaluate_answer and
+assess_code_with_ai (prompt building, rate limiting, HTTP, parsing and repair
+included) and reports p50/p95/p99 per scenario. Fully offline:
+
+    python load_test.py --users 20 --iterations 5 --latency-ms 300 --rate-limit-rate 0.05
+
+Exits non-zero if --max-error-rate or --max-p95-ms is exceeded.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cache
+import streamlit.logger
+from code_assessment import assess_code_with_ai
+from mock_llm_server import start_mock_server, add_server_arguments, server_options
+from rate_limiter import configure_rate_limiter, rate_limiter_stats
+from utils_calibration import request_strengths, evaluate_answer
+
+
+SCENARIOS = ("strengths", "evaluate", "assess", "assess_stream")
+SAMPLE_RESUME = """SUMMARY
+Backend engineer with 5 years of Python experience.
+EXPERIENCE
+Built REST APIs in Django and FastAPI, deployed on AWS with Docker.
+Optimised PostgreSQL queries and maintained pytest suites.
+SKILLS
+Python, SQL, Git, Linux
+"""
+SAMPLE_CODE = """def two_sum(nums, target):
+    seen = {}
+    for i, num in enumerate(nums):
+        if target - num in seen:
+            return [seen[target - num], i]
+        seen[num] = i
+"""
+SAMPLE_TESTS = [{"test_num": 1, "passed": True}, {"test_num": 2, "passed": True}]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-pct * len(ordered) // 100))
+    return ordered[int(rank) - 1]
+
+
+def _run_scenario(name, user, iteration, api_key):
+    """Call one flow with inputs unique to (user, iteration) so the LLM cache can't answer it; True if usable"""
+    tag = f"{user}-{iteration}"
+    if name == "strengths":
+        # Not analyze_resume_strengths: its keyword fallback would hide failed calls
+        strengths, _ = request_strengths(f"{SAMPLE_RESUME}\nCandidate {tag}", api_key)
+        return bool(strengths)
+    if name == "evaluate":
+        result = evaluate_answer("What does zip() do?", f"It pairs up items from iterables ({tag})", api_key)
+        return result.get("score", 0) > 0
+    code = f"{SAMPLE_CODE}# {name} {tag}\n"
+    if name == "assess_stream":
+        return assess_code_with_ai("Two Sum", code, SAMPLE_TESTS, api_key, on_progress=lambda fields, partial: None) is not None
+    return assess_code_with_ai("Two Sum", code, SAMPLE_TESTS, api_key) is not None
+
+
+def run_load(users, iterations, scenarios, api_key="mock-key"):
+    """{scenario: [(latency_seconds, ok)]} from `users` threads each running every scenario `iterations` times"""
+    samples = {name: [] for name in scenarios}
+    lock = threading.Lock()
+
+    def virtual_user(user):
+        for iteration in range(iterations):
+            for name in scenarios:
+                start = time.perf_counter()
+                try:
+                    ok = _run_scenario(name, user, iteration, api_key)
+                except Exception:
+                    ok = False
+                with lock:
+                    samples[name].append((time.perf_counter() - start, ok))
+
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        list(pool.map(virtual_user, range(users)))
+    return samples
+
+
+def summarize(samples, elapsed):
+    report = {}
+    for name, rows in samples.items():
+        latencies = [latency * 1000 for latency, _ in rows]
+        errors = sum(1 for _, ok in rows if not ok)
+        report[name] = {
+            "requests": len(rows),
+            "errors": errors,
+            "error_rate": errors / len(rows) if rows else 0.0,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": max(latencies) if latencies else None,
+            "throughput_rps": len(rows) / elapsed if elapsed else 0.0,
+        }
+    return report
+
+
+def format_report(report):
+    lines = [f"{'scenario':<15}{'reqs':>6}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'req/s':>8}"]
+    for name, row in report.items():
+        lines.append(
+            f"{name:<15}{row['requests']:>6}{row['errors']:>8}{row['p50_ms'] or 0:>10.0f}{row['p95_ms'] or 0:>10.0f}"
+            f"{row['p99_ms'] or 0:>10.0f}{row['max_ms'] or 0:>10.0f}{row['throughput_rps']:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--iterations", type=int, default=3, help="Rounds of every scenario per user")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--rpm", type=int, default=100000, help="Rate limiter requests per minute, per API key")
+    parser.add_argument("--tpm", type=int, default=100000000, help="Rate limiter tokens per minute, per API key")
+    parser.add_argument("--base-url", help="Use an already running mock (or other) server instead of starting one")
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this JSON file")
+    parser.add_argument("--max-error-rate", type=float, help="Fail if any scenario's error rate is higher")
+    parser.add_argument("--max-p95-ms", type=float, help="Fail if any scenario's p95 latency is higher")
+    add_server_arguments(parser)
+    args = parser.parse_args(argv)
+
+    # Isolated LLM cache and API endpoint; both are read when the first cache/client is created
+    cache.CACHE_DIR = tempfile.mkdtemp(prefix="load_test_cache_")
+    server = None
+    if args.base_url:
+        os.environ["GROQ_BASE_URL"] = args.base_url
+    else:
+        server = start_mock_server(**server_options(args))
+        os.environ["GROQ_BASE_URL"] = server.base_url
+
+    streamlit.logger.set_log_level("error")
+    configure_rate_limiter(args.rpm, args.tpm)
+
+    start = time.perf_counter()
+    samples = run_load(args.users, args.iterations, args.scenarios)
+    elapsed = time.perf_counter() - start
+    if server:
+        server.shutdown()
+
+    report = summarize(samples, elapsed)
+    print(format_report(report))
+    print(f"\n{args.users} users x {args.iterations} iterations in {elapsed:.1f}s; "
+          f"throttled {rate_limiter_stats()['throttled']} times")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"args": vars(args), "elapsed_s": elapsed, "report": report}, f, indent=2)
+
+    failed = False
+    for name, row in report.items():
+        if args.max_error_rate is not None and row["error_rate"] > args.max_error_rate:
+            print(f"FAIL {name}: error rate {row['error_rate']:.1%} > {args.max_error_rate:.1%}")
+            failed = True
+        if args.max_p95_ms is not None and (row["p95_ms"] or 0) > args.max_p95_ms:
+            print(f"FAIL {name}: p95 {row['p95_ms']:.0f}ms > {args.max_p95_ms:.0f}ms")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
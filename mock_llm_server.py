@@ -0,0 +1,205 @@
+"""Local stand-in for the Groq chat-completions API, for offline load tests.
+
+Point the app at it with GROQ_BASE_URL=http://127.0.0.1:<port>. Replies are
+canned JSON picked by what the prompt asks for, with configurable latency,
+HTTP errors, 429s and malformed (truncated) replies.
+
+    python mock_llm_server.py --port 8099 --latency-ms 400 --rate-limit-rate 0.05
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+DEFAULT_PORT = 8099
+CHUNK_CHARS = 12
+
+
+def _score(prompt, salt):
+    """Deterministic 4-9 score so repeated prompts get the same reply"""
+    digest = hashlib.sha256((salt + prompt).encode("utf-8")).digest()
+    return 4 + digest[0] % 6
+
+
+def canned_reply(prompt):
+    """JSON reply shaped like what the app's prompt asks for"""
+    if "missing or invalid fields" in prompt:
+        return "{}"
+    if "key strengths" in prompt:
+        return json.dumps({"strengths": [
+            {"strength": "Python", "explanation": "Used across several professional projects."},
+            {"strength": "REST APIs", "explanation": "Designed and shipped backend services."},
+            {"strength": "SQL", "explanation": "Query optimisation and schema design."},
+            {"strength": "Testing", "explanation": "Maintains automated test suites."},
+            {"strength": "Collaboration", "explanation": "Worked with cross-functional teams."},
+        ]})
+    if "interview questions" in prompt:
+        return json.dumps({"questions": [
+            {"question": f"Mock question {i}?", "focus_area": "Technical", "difficulty": "Medium"} for i in range(1, 6)
+        ]})
+    if "Evaluate the following answer" in prompt:
+        return json.dumps({
+            "score": _score(prompt, "answer"),
+            "feedback": "Covers the main idea; could be more precise about edge cases.",
+            "strengths": "Clear explanation",
+            "improvements": "Mention complexity",
+        })
+    if "expert coding interviewer" in prompt:
+        score = _score(prompt, "code")
+        return json.dumps({
+            "correctness_score": score,
+            "code_quality_score": score,
+            "efficiency_score": max(1, score - 1),
+            "overall_score": score,
+            "strengths": ["Readable"],
+            "weaknesses": ["Few comments"],
+            "suggestions": ["Handle empty input"],
+            "verdict": "Pass" if score >= 6 else "Borderline",
+        })
+    return "OK"
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    server_version = "MockLLM/1.0"
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Invalid JSON body"}})
+            return
+
+        config = self.server.config
+        time.sleep(max(0.0, random.gauss(config["latency_ms"], config["jitter_ms"])) / 1000)
+
+        roll = random.random()
+        if roll < config["rate_limit_rate"]:
+            self._send_json(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}},
+                            headers={"retry-after": str(config["retry_after"])})
+            return
+        if roll < config["rate_limit_rate"] + config["error_rate"]:
+            self._send_json(500, {"error": {"message": "Injected server error"}})
+            return
+
+        messages = body.get("messages") or [{}]
+        prompt = messages[-1].get("content") or ""
+        content = canned_reply(prompt)
+        if random.random() < config["malformed_rate"]:
+            content = content[:len(content) // 2]
+
+        if body.get("stream"):
+            self._stream(body, content, config)
+        else:
+            self._send_json(200, _completion(body, prompt, content))
+
+    def _stream(self, body, content, config):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        for start in range(0, len(content), CHUNK_CHARS):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": body.get("model", "mock"),
+                "choices": [{"index": 0, "delta": {"content": content[start:start + CHUNK_CHARS]},
+                             "finish_reason": None}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            if config["chunk_delay_ms"]:
+                time.sleep(config["chunk_delay_ms"] / 1000)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _send_json(self, status, payload, headers=None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _completion(body, prompt, content):
+    prompt_tokens = max(1, len(prompt) // 4)
+    completion_tokens = max(1, len(content) // 4)
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "mock"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                  "total_tokens": prompt_tokens + completion_tokens},
+    }
+
+
+def start_mock_server(port=0, latency_ms=300, jitter_ms=50, chunk_delay_ms=5, error_rate=0.0,
+                      rate_limit_rate=0.0, malformed_rate=0.0, retry_after=1):
+    """Serve the mock API on a background thread; port=0 picks a free port. Stop with server.shutdown()"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), MockLLMHandler)
+    server.daemon_threads = True
+    server.config = {
+        "latency_ms": latency_ms,
+        "jitter_ms": jitter_ms,
+        "chunk_delay_ms": chunk_delay_ms,
+        "error_rate": error_rate,
+        "rate_limit_rate": rate_limit_rate,
+        "malformed_rate": malformed_rate,
+        "retry_after": retry_after,
+    }
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_server_arguments(parser):
+    parser.add_argument("--latency-ms", type=float, default=300, help="Mean time to first byte")
+    parser.add_argument("--jitter-ms", type=float, default=50, help="Std deviation of the latency")
+    parser.add_argument("--chunk-delay-ms", type=float, default=5, help="Delay between streamed chunks")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction answered with HTTP 429")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of replies truncated mid-JSON")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+
+
+def server_options(args):
+    return {
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "chunk_delay_ms": args.chunk_delay_ms,
+        "error_rate": args.error_rate,
+        "rate_limit_rate": args.rate_limit_rate,
+        "malformed_rate": args.malformed_rate,
+        "retry_after": args.retry_after,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    server = start_mock_server(args.port, **server_options(args))
+    print(f"Mock LLM server on {server.base_url} (set GROQ_BASE_URL to this)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
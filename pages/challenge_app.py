@@ -1,9 +1,9 @@
 import streamlit as st
-import sqlite3
 import time
 import json
 from datetime import datetime
-from groq import Groq
+from sandbox import run_tests_in_sandbox
+from db import get_pool, PROGRESS_DB
 
 # --------------------
 # Page Config
@@ -30,55 +30,48 @@ if "ai_assessment" not in st.session_state:
 if "user_code" not in st.session_state:
     st.session_state.user_code = ""
 
-DB_FILE = "data/progress.db"
+DB_FILE = PROGRESS_DB
 
 # --------------------
 # Database Setup
 # --------------------
 def init_db():
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS progress (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT,
-            question_id INTEGER,
-            question_title TEXT,
-            score INTEGER,
-            duration REAL,
-            passed_tests INTEGER,
-            total_tests INTEGER,
-            created_at TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+    with get_pool(DB_FILE).transaction() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS progress (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT,
+                question_id INTEGER,
+                question_title TEXT,
+                score INTEGER,
+                duration REAL,
+                passed_tests INTEGER,
+                total_tests INTEGER,
+                created_at TEXT
+            )
+        """)
 
 def save_progress(username, q_id, title, passed, total, duration, score):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO progress (username, question_id, question_title, score, duration, passed_tests, total_tests, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (username, q_id, title, score, duration, passed, total, datetime.now().isoformat()))
-    conn.commit()
-    conn.close()
+    with get_pool(DB_FILE).transaction() as conn:
+        conn.execute("""
+            INSERT INTO progress (username, question_id, question_title, score, duration, passed_tests, total_tests, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (username, q_id, title, score, duration, passed, total, datetime.now().isoformat()))
 
 def load_leaderboard():
-    conn = sqlite3.connect(DB_FILE)
     df = None
     try:
         import pandas as pd
-        df = pd.read_sql_query("""
-            SELECT username, SUM(score) AS total_score, COUNT(*) AS challenges_completed, 
-                   ROUND(SUM(duration), 2) AS total_time
-            FROM progress
-            GROUP BY username
-            ORDER BY total_score DESC, total_time ASC
-        """, conn)
+        with get_pool(DB_FILE).connection() as conn:
+            df = pd.read_sql_query("""
+                SELECT username, SUM(score) AS total_score, COUNT(*) AS challenges_completed, 
+                       ROUND(SUM(duration), 2) AS total_time
+                FROM progress
+                GROUP BY username
+                ORDER BY total_score DESC, total_time ASC
+            """, conn)
     except Exception:
         pass
-    conn.close()
     return df
 
 init_db()
@@ -134,18 +127,7 @@ total_questions = len(questions)
 # Code Runner
 # --------------------
 def run_code(user_code, tests):
-    results = []
-    for idx, case in enumerate(tests):
-        try:
-            local_vars = {}
-            exec(user_code, {}, local_vars)
-            func = list(local_vars.values())[0]
-            output = func(**case["input"])
-            passed = output == case["expected"]
-            results.append({"passed": passed, "input": case["input"], "expected": case["expected"], "actual": output})
-        except Exception as e:
-            results.append({"passed": False, "error": str(e)})
-    return results
+    return run_tests_in_sandbox(user_code, tests)
 
 # --------------------
 # UI
@@ -200,7 +182,7 @@ if st.session_state.test_results:
         if r["passed"]:
             st.success(f"Test {i} passed ✅ | Input: {r['input']}")
         else:
-            st.error(f"Test {i} failed ❌ | {r.get('error','')}")
+            st.error(f"Test {i} failed ❌ | {r.get('error') or 'Output mismatch'}")
 
 # Leaderboard
 st.divider()
@@ -0,0 +1,116 @@
+import io
+import math
+import os
+import queue
+import threading
+
+from document_cache import read_upload
+from sandbox import SandboxPool, SandboxError
+
+
+# Upload caps: larger files are rejected, extra pages are ignored
+MAX_PDF_BYTES = 10 * 1024 * 1024
+MAX_PDF_PAGES = 50
+# Below this many pages a worker round-trip costs more than it saves
+PARALLEL_MIN_PAGES = 8
+PDF_WORKERS = min(4, os.cpu_count() or 1)
+PDF_WORKER_MEMORY_MB = 512
+PAGE_TIMEOUT_SECONDS = 10
+PAGE_CPU_SECONDS = 8
+
+
+class PDFTooLarge(ValueError):
+    """Raised when an upload is over MAX_PDF_BYTES"""
+
+
+class PDFExtractionError(RuntimeError):
+    """Raised when a worker fails (timeout, memory or CPU limit) before extracting all its pages"""
+
+
+def _page_text(page):
+    return page.extract_text() or ""
+
+
+def iter_page_range(data, start, stop):
+    """Worker target: yield (index, text) for pages start..stop-1 of a PDF given as bytes"""
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    for index in range(start, stop):
+        yield index, _page_text(reader.pages[index])
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pdf_pool():
+    """Worker pool for PDF parsing, separate from the code sandbox so uploads never queue behind test runs"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SandboxPool(PDF_WORKERS, PDF_WORKER_MEMORY_MB, PAGE_CPU_SECONDS)
+        return _pool
+
+
+def _stream_chunk(pool, data, start, stop, results):
+    done = start
+    try:
+        for item in pool.stream(iter_page_range, (data, start, stop), PAGE_TIMEOUT_SECONDS):
+            results.put(item)
+            done += 1
+    except SandboxError as e:
+        results.put(PDFExtractionError(f"pages {done + 1}-{stop} could not be extracted: {e}"))
+    finally:
+        results.put(None)
+
+
+def iter_pdf_pages(file, max_pages=MAX_PDF_PAGES, max_bytes=MAX_PDF_BYTES, parallel=True):
+    """Yield (page_index, page_count, text) as pages are extracted, in completion order.
+
+    Large documents are split across the PDF worker pool. Each worker has a
+    memory cap and a per-page time and CPU limit, so a pathological page
+    can't hold a worker for long; if one hits a limit, PDFExtractionError is
+    raised rather than returning the document with pages missing.
+    parallel=False extracts in this process (e.g. when already running
+    inside a worker).
+    """
+    import PyPDF2
+
+    data = read_upload(file)
+    if len(data) > max_bytes:
+        raise PDFTooLarge(f"PDF is {len(data) / 1e6:.1f} MB; the limit is {max_bytes / 1e6:.0f} MB")
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    count = min(len(reader.pages), max_pages)
+
+    if count < PARALLEL_MIN_PAGES or not parallel:
+        for index in range(count):
+            yield index, count, _page_text(reader.pages[index])
+        return
+
+    pool = get_pdf_pool()
+    chunk = math.ceil(count / pool.size)
+    results = queue.Queue()
+    ranges = [(start, min(start + chunk, count)) for start in range(0, count, chunk)]
+    for start, stop in ranges:
+        threading.Thread(target=_stream_chunk, args=(pool, data, start, stop, results), daemon=True).start()
+
+    running = len(ranges)
+    while running:
+        item = results.get()
+        if item is None:
+            running -= 1
+        elif isinstance(item, PDFExtractionError):
+            raise item
+        else:
+            yield item[0], count, item[1]
+
+
+def extract_pdf_text(file, max_pages=MAX_PDF_PAGES, max_bytes=MAX_PDF_BYTES, on_page=None, parallel=True):
+    """Whole-document text in page order; on_page(done, total) is called as pages finish"""
+    pages = {}
+    for index, count, text in iter_pdf_pages(file, max_pages, max_bytes, parallel):
+        pages[index] = text
+        if on_page:
+            on_page(len(pages), count)
+    return "\n".join(pages[index] for index in sorted(pages))
@@ -0,0 +1,54 @@
+import cProfile
+import pstats
+
+from harness import load_entry_function
+
+
+HOTSPOT_ROWS = 8
+
+
+def _label(filename, lineno, funcname):
+    if filename == '<submission>':
+        return f"{funcname} (line {lineno})"
+    if filename == '~':
+        return funcname.strip('<>')
+    return f"{funcname} ({filename.rsplit('/', 1)[-1]}:{lineno})"
+
+
+def profile_call(func, input_data, top_n=HOTSPOT_ROWS):
+    """Run func once under cProfile and return its hotspots sorted by cumulative time"""
+    profile = cProfile.Profile()
+    if isinstance(input_data, dict):
+        profile.runcall(func, **input_data)
+    else:
+        profile.runcall(func, input_data)
+
+    stats = pstats.Stats(profile).stats
+    rows = []
+    for (filename, lineno, funcname), (primitive_calls, calls, tottime, cumtime, _) in stats.items():
+        if '_lsprof' in funcname:
+            continue
+        rows.append({
+            'function': _label(filename, lineno, funcname),
+            'calls': calls if calls == primitive_calls else f"{calls}/{primitive_calls}",
+            'own_ms': round(tottime * 1000, 3),
+            'cumulative_ms': round(cumtime * 1000, 3),
+            'in_submission': filename == '<submission>',
+        })
+    rows.sort(key=lambda r: r['cumulative_ms'], reverse=True)
+    return rows[:top_n]
+
+
+def iter_profile(code, test_cases, top_n=HOTSPOT_ROWS):
+    """Profile the entry function on the largest test input (runs inside a sandbox worker)"""
+    func = load_entry_function(code)
+    largest = max((t['input'] for t in test_cases), key=lambda i: len(repr(i)))
+    yield profile_call(func, largest, top_n)
+
+
+def format_hotspots(hotspots, limit=5):
+    """Compact one-line-per-hotspot summary for prompts"""
+    return "\n".join(
+        f"- {h['function']}: {h['calls']} calls, {h['cumulative_ms']} ms cumulative, {h['own_ms']} ms own"
+        for h in hotspots[:limit]
+    )
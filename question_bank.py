@@ -0,0 +1,120 @@
+import json
+import math
+import os
+import re
+import threading
+
+from skill_extractor import get_skill_matcher
+
+
+BANK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "calibration_questions.json")
+# One question per slot, in this order
+DIFFICULTY_PLAN = ("Easy", "Medium", "Hard")
+# Used when nothing in the strengths matches the bank, preferring one of the slot's difficulty
+DEFAULT_QUESTION_IDS = ("python-1", "algorithms-1", "data-1")
+# A strength naming a question's tagged skill outweighs loose word overlap
+SKILL_MATCH_WEIGHT = 2.0
+# Score multiplier for a second question on an already-picked topic
+TOPIC_REPEAT_PENALTY = 0.5
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "does", "for", "from", "has", "have", "how", "in", "is",
+    "it", "its", "of", "on", "or", "the", "to", "use", "used", "using", "what", "when", "which", "why", "with",
+    "would", "you", "your", "do", "can", "between", "difference", "explain", "describe", "mentioned", "times",
+    "once", "across", "experience", "strong", "skills", "e.g",
+}
+
+
+def tokenize(text):
+    return [t for t in re.findall(r"[a-z0-9][a-z0-9+#.]*", text.lower().replace("'", "")) if t not in STOPWORDS]
+
+
+class QuestionBank:
+    """Calibration questions with an inverted index by skill tag and TF-IDF over the question text"""
+
+    def __init__(self, questions):
+        self.questions = questions
+        self.by_id = {q["id"]: q for q in questions}
+        self.by_skill = {}
+        self.postings = {}
+        self.idf = {}
+
+        doc_terms = []
+        for index, q in enumerate(questions):
+            for skill in q.get("skills", []):
+                self.by_skill.setdefault(skill, []).append(index)
+            counts = {}
+            for term in tokenize(f"{q['topic']} {q['question']} {' '.join(q.get('skills', []))}"):
+                counts[term] = counts.get(term, 0) + 1
+            doc_terms.append(counts)
+
+        for counts in doc_terms:
+            for term in counts:
+                self.idf[term] = self.idf.get(term, 0) + 1
+        total = len(questions)
+        self.idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in self.idf.items()}
+
+        for index, counts in enumerate(doc_terms):
+            weights = {term: (1 + math.log(tf)) * self.idf[term] for term, tf in counts.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for term, weight in weights.items():
+                self.postings.setdefault(term, []).append((index, weight / norm))
+
+    def score(self, strengths):
+        """{question index: relevance} for a ranked list of {strength, explanation} dicts"""
+        matcher = get_skill_matcher()
+        scores = {}
+        for rank, s in enumerate(strengths):
+            text = f"{s.get('strength', '')} {s.get('explanation', '')}"
+            rank_weight = 1.0 / (1 + 0.25 * rank)
+            for skill in {skill for skill, _ in matcher.find(text)}:
+                for index in self.by_skill.get(skill, ()):
+                    scores[index] = scores.get(index, 0.0) + SKILL_MATCH_WEIGHT * rank_weight
+            # Cosine similarity between the strength's text and each question
+            terms = [t for t in set(tokenize(text)) if t in self.idf]
+            query_norm = math.sqrt(sum(self.idf[t] ** 2 for t in terms)) or 1.0
+            for term in terms:
+                for index, weight in self.postings[term]:
+                    scores[index] = scores.get(index, 0.0) + rank_weight * self.idf[term] * weight / query_norm
+        return scores
+
+    def select(self, strengths, plan=DIFFICULTY_PLAN):
+        """One question per difficulty in plan, most relevant to the strengths, spreading topics"""
+        scores = self.score(strengths or [])
+        chosen = []
+        topics = set()
+        for difficulty in plan:
+            best, best_score = None, 0.0
+            for index, score in scores.items():
+                q = self.questions[index]
+                if q["difficulty"] != difficulty or q in chosen:
+                    continue
+                if q["topic"] in topics:
+                    score *= TOPIC_REPEAT_PENALTY
+                if score > best_score:
+                    best, best_score = q, score
+            if best is None:
+                defaults = [self.by_id[i] for i in DEFAULT_QUESTION_IDS if i in self.by_id and self.by_id[i] not in chosen]
+                best = next((q for q in defaults if q["difficulty"] == difficulty), defaults[0] if defaults else None)
+            if best is not None:
+                chosen.append(best)
+                topics.add(best["topic"])
+        return [dict(q) for q in chosen]
+
+
+def load_questions(path=BANK_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+_bank = None
+_bank_lock = threading.Lock()
+
+
+def get_question_bank():
+    """Process-wide bank, indexed once"""
+    global _bank
+    with _bank_lock:
+        if _bank is None:
+            _bank = QuestionBank(load_questions())
+        return _bank
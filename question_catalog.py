@@ -0,0 +1,80 @@
+import json
+import os
+import threading
+
+from db import connect, QUESTIONS_DB
+
+
+COLUMNS = ("id, title, difficulty, category, description, starter_code, test_cases, solution, "
+           "time_complexity, space_complexity")
+
+
+class QuestionCatalog:
+    """In-memory copy of the questions table, reloaded only when the database file changes.
+
+    PRAGMA data_version on the catalog's own connection changes whenever any
+    other connection commits, so a freshness check costs one pragma and every
+    lookup after it is a dict access. Test cases are parsed once per reload;
+    the returned lists are shared between sessions and must not be mutated.
+    """
+
+    def __init__(self, path=QUESTIONS_DB):
+        self.path = path
+        self._conn = None
+        self._version = None
+        self._lock = threading.Lock()
+        self._summaries = []
+        self._rows = {}
+        self._test_cases = {}
+
+    def _refresh(self):
+        if self._conn is None:
+            self._conn = connect(self.path)
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._version:
+            return
+        # Read after the version: a commit in between just triggers one more reload
+        rows = self._conn.execute(f"SELECT {COLUMNS} FROM questions ORDER BY id").fetchall()
+        self._rows = {row[0]: row for row in rows}
+        self._summaries = [row[:4] for row in rows]
+        self._test_cases = {row[0]: json.loads(row[6]) if row[6] else [] for row in rows}
+        self._version = version
+
+    def summaries(self):
+        """(id, title, difficulty, category) for every question"""
+        with self._lock:
+            self._refresh()
+            return list(self._summaries)
+
+    def question(self, question_id):
+        """Full question row, or None"""
+        with self._lock:
+            self._refresh()
+            return self._rows.get(question_id)
+
+    def test_cases(self, question_id):
+        """Parsed test cases of a question, or None if it is not in the catalog"""
+        with self._lock:
+            self._refresh()
+            return self._test_cases.get(question_id)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._version = None
+
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_question_catalog(path=QUESTIONS_DB):
+    """Process-wide question catalog for a database file"""
+    key = os.path.abspath(path)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = QuestionCatalog(path)
+        return catalog
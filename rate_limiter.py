@@ -0,0 +1,171 @@
+import collections
+import hashlib
+import heapq
+import itertools
+import random
+import threading
+import time
+
+
+# Groq limits for the default model (requests and tokens per minute)
+GROQ_REQUESTS_PER_MINUTE = 30
+GROQ_TOKENS_PER_MINUTE = 12000
+
+# Lower number = served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 1
+
+MAX_RETRIES = 4
+# Distinct API keys with their own budget tracked at once
+MAX_LIMITERS = 256
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
+
+class RateLimitTimeout(Exception):
+    """Waited longer than allowed for rate-limit capacity"""
+
+
+class TokenBucket:
+    """Refills at capacity per minute; may go negative when usage is reconciled after the fact"""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = float(per_minute)
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount):
+        self._refill()
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount):
+        self._refill()
+        self.level -= amount
+
+    def give_back(self, amount):
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """Request/token budget of one API key, shared by every session using that key.
+
+    Callers wait in priority order (then arrival order), so interactive calls
+    overtake queued background work; a 429 pauses everyone on the key, not
+    just the caller that hit it.
+    """
+
+    def __init__(self, requests_per_minute=GROQ_REQUESTS_PER_MINUTE, tokens_per_minute=GROQ_TOKENS_PER_MINUTE):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.throttled = 0
+        self._paused_until = 0.0
+        self._waiting = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    def acquire(self, tokens, priority=PRIORITY_BATCH, timeout=None):
+        """Block until one request and `tokens` tokens may be spent, then spend them"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        ticket = (priority, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    wait = None
+                    if self._waiting[0] == ticket:
+                        wait = max(self._paused_until - time.monotonic(),
+                                   self.requests.wait_time(1), self.tokens.wait_time(tokens))
+                        if wait <= 0:
+                            self.requests.take(1)
+                            self.tokens.take(tokens)
+                            return
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise RateLimitTimeout(f"No rate-limit capacity within {timeout}s")
+                        wait = remaining if wait is None else min(wait, remaining)
+                    self._cond.wait(wait)
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+
+    def settle(self, estimated, actual):
+        """Correct the token bucket once the real usage of a request is known"""
+        with self._cond:
+            if actual < estimated:
+                self.tokens.give_back(estimated - actual)
+            else:
+                self.tokens.take(actual - estimated)
+            self._cond.notify_all()
+
+    def pause(self, seconds):
+        """Hold every caller for `seconds` (e.g. the provider's Retry-After)"""
+        with self._cond:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "waiting": len(self._waiting),
+                "throttled": self.throttled,
+                "requests_available": int(self.requests.level),
+                "tokens_available": int(self.tokens.level),
+            }
+
+
+def backoff_delay(attempt, retry_after=None):
+    """Seconds to wait before retry number `attempt` (0-based): Retry-After if given, else full jitter"""
+    if retry_after is not None:
+        return min(BACKOFF_MAX_SECONDS, retry_after) + random.uniform(0, BACKOFF_BASE_SECONDS)
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+_limits = (GROQ_REQUESTS_PER_MINUTE, GROQ_TOKENS_PER_MINUTE)
+_limiters = collections.OrderedDict()
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter(api_key):
+    """Process-wide limiter for an API key; each key has its own Groq quota, so one user can't starve another"""
+    key = hashlib.sha256((api_key or "").encode()).hexdigest()
+    with _limiter_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = RateLimiter(*_limits)
+            while len(_limiters) > MAX_LIMITERS:
+                # Callers already waiting keep their reference to the evicted limiter
+                _limiters.popitem(last=False)
+        else:
+            _limiters.move_to_end(key)
+        return limiter
+
+
+def rate_limiter_stats():
+    """waiting/throttled summed over every key's limiter"""
+    with _limiter_lock:
+        limiters = list(_limiters.values())
+    stats = [limiter.stats() for limiter in limiters]
+    return {
+        "keys": len(stats),
+        "waiting": sum(s["waiting"] for s in stats),
+        "throttled": sum(s["throttled"] for s in stats),
+    }
+
+
+def configure_rate_limiter(requests_per_minute=GROQ_REQUESTS_PER_MINUTE, tokens_per_minute=GROQ_TOKENS_PER_MINUTE):
+    """Set the per-key limits, e.g. for a paid tier or a load test against a mock server; drops existing limiters"""
+    global _limits
+    with _limiter_lock:
+        _limits = (requests_per_minute, tokens_per_minute)
+        _limiters.clear()
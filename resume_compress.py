@@ -0,0 +1,116 @@
+import re
+
+
+# Rough token estimate for English prose (Llama tokenizers average ~4 chars/token)
+CHARS_PER_TOKEN = 4
+RESUME_TOKEN_BUDGET = 1500
+SECTION_HEAD_LINES = 3
+
+# Section name -> heading keywords, in packing priority order
+SECTIONS = {
+    "skills": ("skills", "technical skills", "core competencies", "technologies", "tech stack", "tools"),
+    "experience": ("experience", "work experience", "professional experience", "employment", "work history"),
+    "projects": ("projects", "personal projects", "selected projects", "portfolio"),
+    "summary": ("summary", "profile", "objective", "about me", "professional summary"),
+    "certifications": ("certifications", "certificates", "licenses", "awards", "achievements"),
+    "education": ("education", "academic background", "qualifications"),
+    "publications": ("publications", "research"),
+}
+OTHER = "other"
+
+BOILERPLATE_PATTERNS = [
+    re.compile(r"^page \d+( of \d+)?$", re.I),
+    re.compile(r"^\d+\s*/\s*\d+$"),
+    re.compile(r"references (are )?available (up)?on request", re.I),
+    re.compile(r"^(curriculum vitae|resume|résumé|cv)$", re.I),
+    re.compile(r"^\S+@\S+\.\S+$"),
+    re.compile(r"^(\+?\d[\d\s().-]{7,}\d)$"),
+    re.compile(r"^(https?://|www\.)\S+$", re.I),
+    re.compile(r"^[\W_]+$"),
+]
+
+
+def estimate_tokens(text):
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+def _section_for_heading(line):
+    """Section name if the line looks like a heading ('SKILLS', 'Work Experience:'), else None"""
+    text = line.strip().rstrip(":").strip().lower()
+    if not text or len(text) > 40:
+        return None
+    for name, keywords in SECTIONS.items():
+        if text in keywords:
+            return name
+    return None
+
+
+def _is_boilerplate(line):
+    return any(p.search(line) for p in BOILERPLATE_PATTERNS)
+
+
+def split_sections(resume_text):
+    """Split resume text into [(section, heading, [lines])] in document order, without boilerplate or repeats"""
+    sections = [(OTHER, None, [])]
+    seen = set()
+    for raw in resume_text.splitlines():
+        line = " ".join(raw.split())
+        if not line or _is_boilerplate(line):
+            continue
+        name = _section_for_heading(line)
+        if name:
+            sections.append((name, line, []))
+            continue
+        # PDF extraction often repeats headers/footers on every page
+        key = line.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        sections[-1][2].append(line)
+    return [s for s in sections if s[2]]
+
+
+def compress_resume(resume_text, token_budget=RESUME_TOKEN_BUDGET):
+    """Pack the most useful resume content into roughly token_budget tokens.
+
+    Every section first gets its heading and first few lines, by priority
+    (skills, experience, projects, ...); the remaining budget is then filled in
+    the same priority order. Output keeps the original section order.
+    """
+    if not resume_text or estimate_tokens(resume_text) <= token_budget:
+        return resume_text
+    sections = split_sections(resume_text)
+    priority = list(SECTIONS) + [OTHER]
+    order = sorted(range(len(sections)), key=lambda i: priority.index(sections[i][0]))
+
+    kept = [[] for _ in sections]
+    headed = set()
+    used = 0
+
+    def take(i, limit):
+        nonlocal used
+        _, heading, lines = sections[i]
+        if heading and i not in headed:
+            cost = estimate_tokens(heading)
+            if used + cost > token_budget:
+                return
+            headed.add(i)
+            used += cost
+        start = len(kept[i])
+        for line in lines[start:limit]:
+            cost = estimate_tokens(line)
+            if used + cost > token_budget:
+                return
+            kept[i].append(line)
+            used += cost
+
+    for i in order:
+        take(i, SECTION_HEAD_LINES)
+    for i in order:
+        take(i, None)
+
+    parts = []
+    for (_, heading, _), lines in zip(sections, kept):
+        if lines:
+            parts.append("\n".join(([heading] if heading else []) + lines))
+    return "\n\n".join(parts)
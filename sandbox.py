@@ -0,0 +1,275 @@
+import io
+import json
+import math
+import queue
+import signal
+import sys
+import threading
+import multiprocessing
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
+
+from harness import iter_test_results
+
+try:
+    import resource
+except ImportError:  # Windows has no rlimits, workers still give us wall-clock kills
+    resource = None
+
+
+# Sandbox limits
+SANDBOX_WORKERS = 4
+TEST_TIMEOUT_SECONDS = 5
+TEST_CPU_SECONDS = 3
+WORKER_MEMORY_MB = 512
+
+
+class SandboxError(Exception):
+    """Raised when a submission cannot be run to completion in the sandbox"""
+
+
+class SandboxTimeout(SandboxError):
+    """Raised when a submission exceeds its wall-clock limit"""
+
+
+# Worker side
+def _apply_memory_limit(memory_mb):
+    """Cap the worker's address space so runaway allocations raise MemoryError"""
+    if resource is None or not memory_mb:
+        return
+    limit = memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+
+def _set_cpu_budget(cpu_seconds):
+    """Allow the worker cpu_seconds more CPU time before SIGXCPU kills it"""
+    if resource is None or not cpu_seconds:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = math.ceil(usage.ru_utime + usage.ru_stime) + cpu_seconds
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _plain(value):
+    """value if JSON can carry it, else its repr (computed here, under the worker's limits)"""
+    try:
+        json.dumps(value, default=repr)
+        return value
+    except Exception:
+        try:
+            return repr(value)
+        except Exception:
+            return f"<unrepresentable {type(value).__name__}>"
+
+
+def _encode(kind, payload):
+    """JSON bytes for a message to the parent.
+
+    Results never cross the pipe as pickles: unpickling an object the
+    submission returned would run its __reduce__ in the Streamlit process,
+    outside every limit. Anything JSON can't express is sent as its repr.
+    """
+    try:
+        return json.dumps([kind, payload], default=repr).encode()
+    except Exception:
+        if isinstance(payload, dict):
+            payload = {str(key): _plain(value) for key, value in payload.items()}
+        else:
+            payload = _plain(payload)
+        return json.dumps([kind, payload], default=repr).encode()
+
+
+def _send(conn, kind, payload):
+    conn.send_bytes(_encode(kind, payload))
+
+
+def _worker_main(conn, memory_mb, cpu_seconds):
+    """Worker loop: receive (target, args), stream every item target yields back"""
+    _apply_memory_limit(memory_mb)
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+
+        target, args, job_cpu_seconds = message
+        budget = job_cpu_seconds or cpu_seconds
+        try:
+            _set_cpu_budget(budget)
+            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                for item in target(*args):
+                    _send(conn, "item", item)
+                    _set_cpu_budget(budget)
+            _send(conn, "done", None)
+        except BaseException as e:
+            try:
+                message = f"{type(e).__name__}: {e}"
+            except BaseException:
+                message = type(e).__name__
+            _send(conn, "error", message)
+
+
+# Parent side
+_spawn_lock = threading.Lock()
+
+
+@contextmanager
+def _isolated_main():
+    """Keep spawned workers from re-running the page script.
+
+    Streamlit executes each page as sys.modules['__main__'], and spawn re-imports
+    __main__ in every child, which would run the page (and start another pool)
+    inside the worker. Point __main__ at this side-effect-free module while a
+    worker starts instead.
+    """
+    with _spawn_lock:
+        main = sys.modules.get('__main__')
+        sys.modules['__main__'] = sys.modules[__name__]
+        try:
+            yield
+        finally:
+            sys.modules['__main__'] = main
+
+
+class SandboxPool:
+    """Pool of pre-started worker processes that run untrusted code off the Streamlit thread"""
+
+    def __init__(self, size=SANDBOX_WORKERS, memory_mb=WORKER_MEMORY_MB, cpu_seconds=TEST_CPU_SECONDS):
+        self.size = size
+        self.memory_mb = memory_mb
+        self.cpu_seconds = cpu_seconds
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.memory_mb, self.cpu_seconds),
+            daemon=True
+        )
+        with _isolated_main():
+            process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def _retire(self, worker):
+        """Hard-kill a worker that overran or crashed and put a fresh one in its place"""
+        process, conn = worker
+        if process.is_alive():
+            process.kill()
+        process.join(1)
+        conn.close()
+        self._idle.put(self._spawn())
+
+    def _crash_reason(self, process, cpu_seconds):
+        process.join(1)
+        if resource is not None and process.exitcode == -signal.SIGXCPU:
+            return f"CPU time limit exceeded ({cpu_seconds}s)"
+        if process.exitcode == -signal.SIGKILL:
+            return "Worker was killed (memory limit exceeded?)"
+        return f"Worker exited unexpectedly (exit code {process.exitcode})"
+
+    def stream(self, target, args=(), timeout=TEST_TIMEOUT_SECONDS, cpu_seconds=None):
+        """Run target(*args) in a worker and yield each item it produces.
+
+        Every item must arrive within `timeout` seconds and use at most
+        `cpu_seconds` of CPU (the pool default if None), otherwise the worker is
+        killed and SandboxTimeout / SandboxError is raised.
+        """
+        cpu_seconds = cpu_seconds or self.cpu_seconds
+        worker = self._idle.get()
+        process, conn = worker
+        healthy = False
+        try:
+            conn.send((target, args, cpu_seconds))
+            while True:
+                if not conn.poll(timeout):
+                    raise SandboxTimeout(f"Time limit exceeded ({timeout}s)")
+                try:
+                    # Plain JSON only, never pickle: see _encode
+                    kind, payload = json.loads(conn.recv_bytes())
+                except (EOFError, OSError):
+                    raise SandboxError(self._crash_reason(process, cpu_seconds))
+                if kind == "done":
+                    healthy = True
+                    return
+                if kind == "error":
+                    healthy = True
+                    raise SandboxError(payload)
+                yield payload
+        finally:
+            if healthy:
+                self._idle.put(worker)
+            else:
+                self._retire(worker)
+
+    def run(self, target, args=(), timeout=TEST_TIMEOUT_SECONDS, cpu_seconds=None):
+        """Run target(*args) in a worker and return all items as a list"""
+        return list(self.stream(target, args, timeout, cpu_seconds))
+
+    def shutdown(self):
+        while True:
+            try:
+                process, conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            process.join(1)
+            if process.is_alive():
+                process.kill()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool():
+    """Process-wide sandbox pool, shared by every Streamlit session"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SandboxPool()
+        return _pool
+
+
+# Test execution
+def run_tests_in_sandbox(code, test_cases, timeout=TEST_TIMEOUT_SECONDS):
+    """Run all test cases as one compile-once batch in a pooled worker.
+
+    Each test still has its own time limit: if one overruns, it is recorded as
+    failed and the remaining tests continue in a fresh worker.
+    """
+    pool = get_sandbox_pool()
+    results = []
+    while len(results) < len(test_cases):
+        remaining = test_cases[len(results):]
+        try:
+            for result in pool.stream(iter_test_results, (code, remaining, len(results) + 1), timeout):
+                results.append(result)
+        except SandboxError as e:
+            test = test_cases[len(results)]
+            results.append({
+                'test_num': len(results) + 1,
+                'passed': False,
+                'input': test.get('input'),
+                'expected': test.get('expected'),
+                'duration_ms': None,
+                'error': str(e)
+            })
+    return results
@@ -0,0 +1,162 @@
+import collections
+import json
+import os
+
+from resume_compress import split_sections
+
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_taxonomy.json")
+TOP_SKILLS = 5
+# A mention in experience/projects says more than one in a bare skills list
+SECTION_WEIGHTS = {
+    "experience": 3.0,
+    "projects": 2.5,
+    "certifications": 2.0,
+    "publications": 2.0,
+    "skills": 1.5,
+    "summary": 1.5,
+    "education": 1.0,
+    "other": 1.0,
+}
+MAX_EXAMPLES = 3
+
+
+class AhoCorasick:
+    """Multi-pattern matcher: finds every occurrence of every pattern in one pass over the text"""
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                if ch not in self._goto[node]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[node][ch] = len(self._goto) - 1
+                node = self._goto[node][ch]
+            self._out[node].append(index)
+
+        # Breadth-first so each node's fail link is resolved before its children's
+        queue = collections.deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def iter_matches(self, text):
+        """Yield (start, end, pattern_index) for every match, end exclusive"""
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for index in self._out[node]:
+                yield pos + 1 - len(self.patterns[index]), pos + 1, index
+
+
+def load_taxonomy(path=TAXONOMY_PATH):
+    """{skill: {"category": ..., "aliases": [...]}} from the taxonomy file"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class SkillMatcher:
+    """Finds taxonomy skills in free text, whole words only, longest alias wins on overlap"""
+
+    def __init__(self, taxonomy):
+        self.taxonomy = taxonomy
+        self.aliases = []
+        self.skills = []
+        for skill, entry in taxonomy.items():
+            for alias in set(a.lower() for a in entry.get("aliases", []) + [skill]):
+                self.aliases.append(alias)
+                self.skills.append(skill)
+        self.automaton = AhoCorasick(self.aliases)
+
+    def find(self, text):
+        """[(skill, alias)] for each non-overlapping whole-word mention in text"""
+        text = text.lower()
+        matches = [
+            (start, end, index) for start, end, index in self.automaton.iter_matches(text)
+            if _is_word_boundary(text, start - 1) and _is_word_boundary(text, end)
+        ]
+        # 'react native' should not also count as 'react'
+        matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+        found = []
+        last_end = 0
+        for start, end, index in matches:
+            if start >= last_end:
+                found.append((self.skills[index], self.aliases[index]))
+                last_end = end
+        return found
+
+
+def _is_word_boundary(text, pos):
+    return pos < 0 or pos >= len(text) or not (text[pos].isalnum() or text[pos] == "_")
+
+
+_matcher = None
+
+
+def get_skill_matcher():
+    global _matcher
+    if _matcher is None:
+        _matcher = SkillMatcher(load_taxonomy())
+    return _matcher
+
+
+def score_skills(resume_text, matcher=None):
+    """{skill: {"score", "mentions", "sections", "aliases"}} weighted by the section each mention is in"""
+    matcher = matcher or get_skill_matcher()
+    scores = {}
+    for section, _, lines in split_sections(resume_text or ""):
+        weight = SECTION_WEIGHTS.get(section, 1.0)
+        for skill, alias in matcher.find("\n".join(lines)):
+            entry = scores.setdefault(skill, {"score": 0.0, "mentions": 0, "sections": [], "aliases": []})
+            entry["score"] += weight
+            entry["mentions"] += 1
+            if section not in entry["sections"]:
+                entry["sections"].append(section)
+            if alias not in entry["aliases"]:
+                entry["aliases"].append(alias)
+    return scores
+
+
+def _explain(skill, entry, category):
+    sections = [s for s in entry["sections"] if s != "other"]
+    where = f" {'in' if len(sections) == 1 else 'across'} {', '.join(sections)}" if sections else ""
+    times = "once" if entry["mentions"] == 1 else f"{entry['mentions']} times"
+    examples = [a for a in entry["aliases"] if a != skill.lower()][:MAX_EXAMPLES]
+    evidence = f" (e.g. {', '.join(examples)})" if examples else ""
+    return f"{category}: mentioned {times}{where}{evidence}."
+
+
+def extract_skills(resume_text, top_n=TOP_SKILLS):
+    """Offline strength profiling: [{strength, explanation}] like analyze_resume_strengths, no API call"""
+    matcher = get_skill_matcher()
+    scores = score_skills(resume_text, matcher)
+    ranked = sorted(scores.items(), key=lambda item: (-item[1]["score"], -item[1]["mentions"], item[0]))
+    return [
+        {"strength": skill, "explanation": _explain(skill, entry, matcher.taxonomy[skill].get("category", "Skill"))}
+        for skill, entry in ranked[:top_n]
+    ]
+
+
+def skill_excerpt(resume_text):
+    """Only the section headings and lines that mention a known skill, to shrink LLM prompts"""
+    matcher = get_skill_matcher()
+    parts = []
+    for _, heading, lines in split_sections(resume_text or ""):
+        kept = [line for line in lines if matcher.find(line)]
+        if kept:
+            parts.append("\n".join(([heading] if heading else []) + kept))
+    return "\n\n".join(parts)
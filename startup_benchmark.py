@@ -0,0 +1,108 @@
+"""Cold-start import benchmark for the Streamlit pages.
+
+Reads each page's top-level imports, imports them in fresh interpreters under
+`python -X importtime`, and reports the median cost per module on top of the
+Streamlit baseline. Fails (exit 1) when a page is over its import budget or
+loads one of the heavy, first-use-only dependencies at import time.
+
+    python startup_benchmark.py --runs 5
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PAGES = ("app.py", "live_coding.py", "pages/challenge_app.py")
+BASELINE_MODULE = "streamlit"
+# Imported only when the feature that needs them is used
+HEAVY_MODULES = ("groq", "httpx", "PyPDF2", "docx", "pydantic", "pyarrow", "pandas")
+IMPORT_BUDGET_MS = 100
+RUNS = 5
+
+
+def page_imports(path):
+    """Top-level module names a page imports, in order"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            if name not in modules:
+                modules.append(name)
+    return modules
+
+
+def measure_once(modules):
+    """({top-level module: cumulative import us}, heavy modules loaded) from one fresh interpreter"""
+    code = "; ".join(
+        [f"import {BASELINE_MODULE}"] + [f"import {m}" for m in modules]
+        + ["import sys, json", f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"]
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue  # nested import, already counted in its parent
+        timings[name.strip()] = int(cumulative)
+    return timings, json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def benchmark_page(path, runs=RUNS):
+    modules = [m for m in page_imports(path) if m != BASELINE_MODULE]
+    samples, heavy = {}, set()
+    for _ in range(runs):
+        timings, loaded = measure_once(modules)
+        heavy.update(loaded)
+        for name, us in timings.items():
+            samples.setdefault(name, []).append(us)
+    top_level = {name: statistics.median(values) / 1000 for name, values in samples.items()}
+    page_modules = {m.split(".")[0] for m in modules}
+    return {
+        "page": path,
+        "baseline_ms": top_level.get(BASELINE_MODULE, 0.0),
+        "modules_ms": {name: ms for name, ms in top_level.items() if name.split(".")[0] in page_modules},
+        "heavy_loaded": sorted(heavy),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=RUNS, help="Fresh interpreters per page (median is reported)")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS,
+                        help="Max import time per page on top of Streamlit")
+    parser.add_argument("--top", type=int, default=8, help="Slowest modules to list per page")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for page in PAGES:
+        result = benchmark_page(os.path.join(ROOT, page), args.runs)
+        total = sum(result["modules_ms"].values())
+        over = total > args.budget_ms
+        print(f"{page}: {total:.1f} ms of page imports (budget {args.budget_ms:.0f} ms), "
+              f"{result['baseline_ms']:.1f} ms {BASELINE_MODULE}{'  OVER BUDGET' if over else ''}")
+        for name, ms in sorted(result["modules_ms"].items(), key=lambda item: -item[1])[:args.top]:
+            print(f"    {ms:8.1f} ms  {name}")
+        if result["heavy_loaded"]:
+            print(f"    loaded at import time: {', '.join(result['heavy_loaded'])}")
+        failed = failed or over or bool(result["heavy_loaded"])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
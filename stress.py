@@ -0,0 +1,155 @@
+import functools
+import random
+import string
+import time
+
+from harness import load_entry_function, call_entry, outputs_match
+from sandbox import get_sandbox_pool, SandboxError
+
+
+STRESS_SIZES = (10 ** 4, 10 ** 5, 10 ** 6)
+STRESS_TIMEOUT_SECONDS = 30
+STRESS_CPU_SECONDS = 20
+STRESS_SEED = 42
+
+
+# Input generators: generate(n, rng) -> test input of size n
+def _two_sum(n, rng):
+    # Exactly one valid pair, both far from the front, so brute force does its full O(n^2) scan
+    nums = rng.sample(range(1, 5 * n), n - 2)
+    target = 30 * n
+    a = rng.randint(10 * n, 15 * n)
+    nums.insert(rng.randint(len(nums) // 2, len(nums)), a)
+    nums.insert(rng.randint(len(nums) // 2, len(nums)), target - a)
+    return {"nums": nums, "target": target}
+
+
+def _reverse_string(n, rng):
+    return {"s": [rng.choice(string.ascii_letters) for _ in range(n)]}
+
+
+def _valid_palindrome(n, rng):
+    # Worst case: a real palindrome with punctuation, so the whole string is scanned
+    half = "".join(rng.choice(string.ascii_letters + " ,:") for _ in range(n // 2))
+    return {"s": half + half[::-1]}
+
+
+def _fibonacci(n, rng):
+    return {"n": n}
+
+
+def _binary_search(n, rng):
+    nums = sorted(rng.sample(range(-5 * n, 5 * n), n))
+    return {"nums": nums, "target": rng.choice([nums[-1], 5 * n + 1])}
+
+
+def _find_max(n, rng):
+    return {"nums": [rng.randint(-10 ** 9, 10 ** 9) for _ in range(n)]}
+
+
+# Questions that declare a generator, keyed by question title
+GENERATORS = {
+    "Two Sum": {"generate": _two_sum, "sizes": STRESS_SIZES},
+    "Reverse String": {"generate": _reverse_string, "sizes": STRESS_SIZES},
+    "Valid Palindrome": {"generate": _valid_palindrome, "sizes": STRESS_SIZES},
+    # Big-integer additions make large n quadratic in practice, keep sizes modest; complexity
+    # runs stop while the numbers are still a few machine words, where the loop is linear
+    "Fibonacci Number": {"generate": _fibonacci, "sizes": (10 ** 3, 10 ** 4, 5 * 10 ** 4),
+                         "complexity_max_size": 2 ** 11},
+    "Binary Search": {"generate": _binary_search, "sizes": STRESS_SIZES},
+    "Find Maximum": {"generate": _find_max, "sizes": STRESS_SIZES},
+    "Check Palindrome": {"generate": _valid_palindrome, "sizes": STRESS_SIZES},
+}
+
+
+def has_generator(title):
+    return title in GENERATORS
+
+
+def generate_input(title, n, seed=STRESS_SEED):
+    """Deterministic input of size n for a question (same seed, same input)"""
+    return GENERATORS[title]["generate"](n, random.Random(f"{seed}:{n}"))
+
+
+def complexity_max_size(title):
+    """Largest n complexity estimates should use for a question, or None for the default"""
+    return GENERATORS.get(title, {}).get("complexity_max_size")
+
+
+def input_maker(title, seed=STRESS_SEED):
+    """Picklable make_input(n) callable, usable by complexity.iter_growth_measurements"""
+    return functools.partial(generate_input, title, seed=seed)
+
+
+# Stress run (runs inside a sandbox worker)
+def _timed_call(func, input_data):
+    start = time.perf_counter()
+    output = call_entry(func, input_data)
+    elapsed = time.perf_counter() - start
+    # In-place solutions (e.g. reverse_string) return None, so compare the mutated input too
+    return (output, input_data), elapsed
+
+
+def iter_stress_results(code, solution_code, title, sizes, seed=STRESS_SEED):
+    """Yield one comparison of candidate vs reference solution per input size.
+
+    passed is None for sizes the reference solution itself failed on.
+    """
+    candidate = load_entry_function(code)
+    reference = load_entry_function(solution_code)
+    for n in sizes:
+        try:
+            expected, reference_seconds = _timed_call(reference, generate_input(title, n, seed))
+        except Exception as e:
+            # Not the candidate's fault: report the size as unchecked, not failed
+            yield {
+                "n": n,
+                "passed": None,
+                "candidate_seconds": None,
+                "reference_seconds": None,
+                "ratio": None,
+                "error": f"Reference solution failed: {str(e) or type(e).__name__}",
+            }
+            continue
+        try:
+            actual, candidate_seconds = _timed_call(candidate, generate_input(title, n, seed))
+            error = None
+        except Exception as e:
+            actual, candidate_seconds, error = None, None, str(e) or type(e).__name__
+        yield {
+            "n": n,
+            "passed": error is None and outputs_match(actual, expected),
+            "candidate_seconds": candidate_seconds,
+            "reference_seconds": reference_seconds,
+            "ratio": candidate_seconds / max(reference_seconds, 1e-9) if candidate_seconds is not None else None,
+            "error": error,
+        }
+
+
+def run_stress_test(code, solution_code, title, sizes=None, timeout=STRESS_TIMEOUT_SECONDS):
+    """Stress the submission against the stored solution on large generated inputs.
+
+    Sizes run smallest first; once one overruns its limits the larger ones are
+    reported as skipped.
+    """
+    if not has_generator(title):
+        return []
+    sizes = list(sizes or GENERATORS[title]["sizes"])
+    results = []
+    try:
+        for result in get_sandbox_pool().stream(
+            iter_stress_results, (code, solution_code, title, sizes), timeout, STRESS_CPU_SECONDS
+        ):
+            results.append(result)
+    except SandboxError as e:
+        failed_at = len(results)
+        for i, n in enumerate(sizes[failed_at:]):
+            results.append({
+                "n": n,
+                "passed": False,
+                "candidate_seconds": None,
+                "reference_seconds": None,
+                "ratio": None,
+                "error": str(e) if i == 0 else "Skipped after previous size failed",
+            })
+    return results
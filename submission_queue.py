@@ -0,0 +1,132 @@
+import collections
+import itertools
+import threading
+import time
+
+from sandbox import SANDBOX_WORKERS
+
+
+MAX_PENDING_JOBS = 64
+MAX_JOBS_PER_CANDIDATE = 2
+QUEUE_WORKERS = SANDBOX_WORKERS
+JOB_TTL_SECONDS = 600
+
+
+class QueueFull(Exception):
+    """Raised when a submission cannot be accepted right now"""
+
+
+class SubmissionQueue:
+    """Bounded in-process job queue with round-robin scheduling across candidates.
+
+    Jobs run on background threads so the Streamlit script never blocks on a
+    submission; the UI polls status() on each rerun.
+    """
+
+    def __init__(self, workers=QUEUE_WORKERS, max_pending=MAX_PENDING_JOBS, max_per_candidate=MAX_JOBS_PER_CANDIDATE):
+        self.max_pending = max_pending
+        self.max_per_candidate = max_per_candidate
+        self._cond = threading.Condition()
+        self._pending = collections.OrderedDict()  # candidate_id -> deque of job ids, in turn order
+        self._jobs = {}
+        self._ids = itertools.count(1)
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f"submission-worker-{i}", daemon=True).start()
+
+    def submit(self, candidate_id, func, *args):
+        """Queue func(*args) for a candidate and return the job id"""
+        with self._cond:
+            self._prune()
+            queued = sum(len(jobs) for jobs in self._pending.values())
+            if queued >= self.max_pending:
+                raise QueueFull("The server is busy, please try again in a few seconds")
+            active = [j for j in self._jobs.values()
+                      if j['candidate_id'] == candidate_id and j['state'] in ('queued', 'running')]
+            if len(active) >= self.max_per_candidate:
+                raise QueueFull("You already have submissions in progress, please wait for them to finish")
+
+            job_id = next(self._ids)
+            self._jobs[job_id] = {
+                'id': job_id,
+                'candidate_id': candidate_id,
+                'func': func,
+                'args': args,
+                'state': 'queued',
+                'result': None,
+                'error': None,
+                'submitted_at': time.time(),
+                'finished_at': None,
+            }
+            self._pending.setdefault(candidate_id, collections.deque()).append(job_id)
+            self._cond.notify()
+            return job_id
+
+    def status(self, job_id):
+        """Current state of a job: queued (with position), running, done or failed"""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return {'state': 'unknown'}
+            status = {k: job[k] for k in ('state', 'result', 'error')}
+            if job['state'] == 'queued':
+                status['position'] = self._position(job)
+            return status
+
+    def _position(self, job):
+        """Approximate place in line under round-robin: rounds ahead times candidates waiting"""
+        jobs = self._pending.get(job['candidate_id'], ())
+        rounds_ahead = list(jobs).index(job['id']) if job['id'] in jobs else 0
+        candidates = list(self._pending)
+        turn = candidates.index(job['candidate_id']) if job['candidate_id'] in candidates else 0
+        return rounds_ahead * len(candidates) + turn + 1
+
+    def _next_job(self):
+        # Round robin: take the first candidate's oldest job, then send them to the back of the line
+        candidate_id, jobs = next(iter(self._pending.items()))
+        job_id = jobs.popleft()
+        del self._pending[candidate_id]
+        if jobs:
+            self._pending[candidate_id] = jobs
+        return self._jobs[job_id]
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                job = self._next_job()
+                job['state'] = 'running'
+
+            try:
+                result, error, state = job['func'](*job['args']), None, 'done'
+            except Exception as e:
+                result, error, state = None, str(e), 'failed'
+
+            with self._cond:
+                job.update(state=state, result=result, error=error, finished_at=time.time(), func=None, args=None)
+
+    def _prune(self):
+        """Forget finished jobs nobody collected"""
+        cutoff = time.time() - JOB_TTL_SECONDS
+        for job_id in [j['id'] for j in self._jobs.values() if j['finished_at'] and j['finished_at'] < cutoff]:
+            del self._jobs[job_id]
+
+    def forget(self, job_id):
+        """Drop a finished job once its result has been collected"""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job and job['state'] in ('done', 'failed'):
+                del self._jobs[job_id]
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_submission_queue():
+    """Process-wide submission queue, shared by every Streamlit session"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = SubmissionQueue()
+        return _queue
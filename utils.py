@@ -1,65 +1,73 @@
-import json
-import io
 import streamlit as st
-from groq import Groq
-import random
-
-
-# Try importing PDF/DOCX libraries
-try:
-    import PyPDF2
-except ImportError:
-    st.warning("PyPDF2 not installed. Install with: pip install PyPDF2")
-
-try:
-    from docx import Document
-except ImportError:
-    st.warning("python-docx not installed. Install with: pip install python-docx")
+from groq_client import chat_completion, stream_chat_completion
+from rate_limiter import PRIORITY_INTERACTIVE
+from json_stream import IncrementalJSONObject
+from resume_compress import compress_resume, RESUME_TOKEN_BUDGET
+from skill_extractor import extract_skills, skill_excerpt
+from question_bank import get_question_bank
+from document_cache import cached_extract
+from docx_extract import extract_docx_text
+from pdf_extract import extract_pdf_text
 
 
 # Helper functions
-def extract_text_from_pdf(file):
-    """Extract text from PDF file"""
+def extract_text_from_pdf(file, on_page=None):
+    """Extract text from PDF file (large files are split across worker processes).
+
+    Pass on_page(done, total) to report progress as pages finish.
+    """
     try:
-        pdf_reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
+        return cached_extract("pdf", file, lambda data: extract_pdf_text(data, on_page=on_page))
+    except ImportError:
+        st.error("PyPDF2 not installed. Install with: pip install PyPDF2")
+        return ""
     except Exception as e:
         st.error(f"Error reading PDF: {e}")
         return ""
 
 
 def extract_text_from_docx(file):
-    """Extract text from DOCX file"""
+    """Extract text from DOCX file (paragraphs, tables and text boxes, streamed)"""
     try:
-        doc = Document(file)
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return text
+        return cached_extract("docx", file, extract_docx_text)
     except Exception as e:
         st.error(f"Error reading DOCX: {e}")
         return ""
 
 
-def call_groq_api(prompt, api_key, max_tokens=1000):
-    """Call Groq API with given prompt"""
+def call_groq_api(prompt, api_key, max_tokens=1000, use_cache=True):
+    """Call Groq API with given prompt (identical requests are served from the LLM cache)"""
+    try:
+        return chat_completion(prompt, api_key, max_tokens=max_tokens, temperature=0.7, use_cache=use_cache)
+    except Exception as e:
+        st.error(f"Error calling Groq API: {e}")
+        return None
+
+
+def call_groq_api_stream(prompt, api_key, max_tokens=1000, on_progress=None):
+    """Stream a Groq reply, calling on_progress(fields, partial) as its JSON fields complete"""
+    parser = IncrementalJSONObject()
     try:
-        client = Groq(api_key=api_key)
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile", #"llama-3.1-70b-versatile",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=max_tokens,
-            temperature=0.7
-        )
-        return response.choices[0].message.content
+        for chunk in stream_chat_completion(prompt, api_key, max_tokens=max_tokens, temperature=0.7):
+            parser.feed(chunk)
+            if on_progress:
+                on_progress(parser.fields, parser.partial)
+        return parser.text
     except Exception as e:
         st.error(f"Error calling Groq API: {e}")
         return None
 
 
-def analyze_resume_strengths(resume_text, api_key):
-    """Analyze resume and extract top strengths"""
+def request_strengths(resume_text, api_key, token_budget=RESUME_TOKEN_BUDGET, prefilter=False,
+                      priority=PRIORITY_INTERACTIVE):
+    """Ask the AI for the top strengths: (strengths, raw reply), strengths None if the reply is unusable.
+
+    Groq errors are raised rather than shown, so headless callers can tell a
+    failed call from a fallback.
+    """
+    if prefilter:
+        resume_text = skill_excerpt(resume_text) or resume_text
+    resume_text = compress_resume(resume_text, token_budget)
     prompt = f"""Analyze the following resume and identify the top 5 key strengths of the candidate. 
 For each strength, provide a brief explanation.
 
@@ -70,28 +78,44 @@ Return the response in JSON format:
 {{"strengths": [{{"strength": "...", "explanation": "..."}}, ...]}}
 """
 
-    response = call_groq_api(prompt, api_key)
+    response = chat_completion(prompt, api_key, max_tokens=1000, temperature=0.7, priority=priority)
+    if not response:
+        return None, response
+    from llm_schemas import parse_structured, StrengthsReply
+    result = parse_structured(response, StrengthsReply, prompt, api_key)
+    return ([s.model_dump() for s in result.strengths] if result else None), response
+
+
+def analyze_resume_strengths(resume_text, api_key, token_budget=RESUME_TOKEN_BUDGET, prefilter=False):
+    """Analyze resume and extract top strengths.
+
+    Without an API key (or if the AI call fails or its reply is unusable) this
+    falls back to the offline keyword matcher. prefilter=True sends the AI only
+    the resume lines that mention a known skill.
+    """
+    if not api_key:
+        return extract_skills(resume_text)
+    try:
+        strengths, response = request_strengths(resume_text, api_key, token_budget, prefilter)
+    except Exception as e:
+        st.error(f"Error calling Groq API: {e}")
+        return extract_skills(resume_text)
+    if strengths is not None:
+        return strengths
     if response:
-        try:
-            # Extract JSON from response
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            json_str = response[json_start:json_end]
-            data = json.loads(json_str)
-            return data.get('strengths', [])
-        except:
-            # Fallback: parse as text
-            return [{"strength": "Analysis completed", "explanation": response}]
-    return []
+        # Fallback: keyword matches, else the raw text
+        return extract_skills(resume_text) or [{"strength": "Analysis completed", "explanation": response}]
+    return extract_skills(resume_text)
 
 
-def generate_interview_questions(resume_text, job_description, api_key):
+def generate_interview_questions(resume_text, job_description, api_key, token_budget=500):
     """Generate 5 relevant interview questions"""
+    resume_text = compress_resume(resume_text, token_budget)
     prompt = f"""Based on the following resume and job description, generate 5 relevant interview questions.
 The questions should test technical skills, behavioral competencies, and role fit.
 
 Resume:
-{resume_text[:2000]}...
+{resume_text}
 
 Job Description:
 {job_description}
@@ -105,26 +129,23 @@ Difficulty can be: Easy, Medium, Hard
 
     response = call_groq_api(prompt, api_key, max_tokens=1500)
     if response:
-        try:
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            json_str = response[json_start:json_end]
-            data = json.loads(json_str)
-            return data.get('questions', [])
-        except:
-            return []
+        from llm_schemas import parse_structured, QuestionsReply
+        result = parse_structured(response, QuestionsReply, prompt, api_key, max_tokens=1500)
+        if result:
+            return [q.model_dump() for q in result.questions]
     return []
 
 
 def generate_calibration_test(strengths, api_key):
-    return [
-        {"topic": "Python", "difficulty": "Easy", "question": "What does the 'zip()' function do in Python?"},
-        {"topic": "Algorithms", "difficulty": "Medium", "question": "Explain the time complexity of binary search."},
-        {"topic": "Data", "difficulty": "Medium", "question": "How would you handle missing values in a dataset?"},
-    ]
-
-def evaluate_answer(question, answer, api_key):
-    """Evaluate candidate's answer to a question"""
+    """Pick calibration questions for the profiled strengths from the local question bank (no API call)"""
+    return get_question_bank().select(strengths)
+
+def evaluate_answer(question, answer, api_key, on_progress=None):
+    """Evaluate candidate's answer to a question.
+
+    Pass on_progress(fields, partial) to stream the reply and render the score
+    and feedback as they arrive.
+    """
     prompt = f"""You are an experienced interviewer. Evaluate the following answer to an interview question.
 Provide a score (1-10) and brief feedback.
 
@@ -136,14 +157,15 @@ Return in JSON format:
 {{"score": X, "feedback": "...", "strengths": "...", "improvements": "..."}}
 """
 
-    response = call_groq_api(prompt, api_key, max_tokens=500)
+    if on_progress:
+        response = call_groq_api_stream(prompt, api_key, max_tokens=500, on_progress=on_progress)
+    else:
+        response = call_groq_api(prompt, api_key, max_tokens=500)
     if response:
-        try:
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            json_str = response[json_start:json_end]
-            return json.loads(json_str)
-        except:
-            return {"score": 0, "feedback": response}
+        from llm_schemas import parse_structured, Evaluation
+        result = parse_structured(response, Evaluation, prompt, api_key, max_tokens=500)
+        if result:
+            return result.model_dump()
+        return {"score": 0, "feedback": response}
     return {"score": 0, "feedback": "Unable to evaluate"}
 